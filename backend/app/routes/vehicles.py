@@ -15,6 +15,8 @@ from app.services.vehicle_service import VehicleService
 
 router = APIRouter()
 
+VEHICLE_DELETED_MESSAGE = "Vehículo eliminado exitosamente"
+
 
 @router.post("/", response_model=VehicleResponse, status_code=status.HTTP_201_CREATED)
 def create_vehicle(
@@ -69,6 +71,8 @@ def list_vehicles(
 
 @router.get("/with-owners", response_model=list[VehicleWithOwner])
 def list_vehicles_with_owners(
+    vehicle_id: Optional[str] = Query(None, description="Filtrar por vehículo"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Cantidad máxima de resultados"),
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db)
 ):
@@ -78,7 +82,7 @@ def list_vehicles_with_owners(
     Only accessible by ADMIN.
     """
     service = VehicleService(db)
-    vehicles = service.list_with_owners()
+    vehicles = service.list_with_owners(vehicle_id, limit)
 
     result = []
     for vehicle in vehicles:
@@ -173,4 +177,4 @@ def delete_vehicle(
     """
     service = VehicleService(db)
     service.delete(vehicle_id, current_user)
-    return {"message": "Vehículo eliminado exitosamente"}
+    return {"message": VEHICLE_DELETED_MESSAGE}
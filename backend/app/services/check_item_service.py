@@ -32,9 +32,7 @@ class CheckItemService:
         Raises:
             HTTPException: If template not found
         """
-        template = self.db.query(CheckItemTemplate).filter(
-            CheckItemTemplate.id == template_id
-        ).first()
+        template = self.db.get(CheckItemTemplate, template_id)
 
         if not template:
             raise HTTPException(
@@ -115,9 +113,7 @@ class CheckItemService:
         Raises:
             HTTPException: If template not found or conflicts exist
         """
-        template = self.db.query(CheckItemTemplate).filter(
-            CheckItemTemplate.id == template_id
-        ).first()
+        template = self.db.get(CheckItemTemplate, template_id)
 
         if not template:
             raise HTTPException(
@@ -170,9 +166,7 @@ class CheckItemService:
         Raises:
             HTTPException: If template not found or is being used
         """
-        template = self.db.query(CheckItemTemplate).filter(
-            CheckItemTemplate.id == template_id
-        ).first()
+        template = self.db.get(CheckItemTemplate, template_id)
 
         if not template:
             raise HTTPException(
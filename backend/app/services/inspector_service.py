@@ -1,6 +1,6 @@
 from typing import List, Optional, Tuple
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager
 from app.models import Inspector, User, UserRole, generate_uuid
 
 
@@ -25,7 +25,7 @@ class InspectorService:
             HTTPException: If validation fails
         """
         # Verify user exists and is an inspector
-        user = self.db.query(User).filter(User.id == user_id).first()
+        user = self.db.get(User, user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -88,7 +88,7 @@ class InspectorService:
             Tuple of (inspectors list, total count)
         """
         # Build query
-        query = self.db.query(Inspector).join(User)
+        query = self.db.query(Inspector).join(Inspector.user)
 
         # Filter by active status
         if active_only is not None:
@@ -99,7 +99,15 @@ class InspectorService:
 
         # Apply pagination
         offset = (page - 1) * page_size
-        inspectors = query.order_by(Inspector.created_at.desc()).offset(offset).limit(page_size).all()
+        # The route reads inspector.user for every row; fill it from the JOIN
+        # instead of issuing one query per inspector.
+        inspectors = (
+            query.options(contains_eager(Inspector.user))
+            .order_by(Inspector.created_at.desc())
+            .offset(offset)
+            .limit(page_size)
+            .all()
+        )
 
         return inspectors, total
 
@@ -116,7 +124,7 @@ class InspectorService:
         Raises:
             HTTPException: If inspector not found
         """
-        inspector = self.db.query(Inspector).filter(Inspector.id == inspector_id).first()
+        inspector = self.db.get(Inspector, inspector_id)
 
         if not inspector:
             raise HTTPException(
@@ -146,7 +154,7 @@ class InspectorService:
         Raises:
             HTTPException: If inspector not found or conflicts exist
         """
-        inspector = self.db.query(Inspector).filter(Inspector.id == inspector_id).first()
+        inspector = self.db.get(Inspector, inspector_id)
 
         if not inspector:
             raise HTTPException(
@@ -186,7 +194,7 @@ class InspectorService:
         Raises:
             HTTPException: If inspector not found
         """
-        inspector = self.db.query(Inspector).filter(Inspector.id == inspector_id).first()
+        inspector = self.db.get(Inspector, inspector_id)
 
         if not inspector:
             raise HTTPException(
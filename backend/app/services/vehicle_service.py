@@ -1,7 +1,7 @@
 from typing import List, Optional, Tuple
 from datetime import datetime
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, raiseload
 from sqlalchemy import or_
 from app.models import Vehicle, User, UserRole, AnnualInspection, AnnualStatus, generate_uuid
 
@@ -197,14 +197,35 @@ class VehicleService:
 
         return vehicles, total
 
-    def list_with_owners(self) -> List[Vehicle]:
+    def list_with_owners(
+        self,
+        vehicle_id: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Vehicle]:
         """
         List all vehicles with owner details.
 
+        Args:
+            vehicle_id: Restrict the result to a single vehicle (optional)
+            limit: Maximum number of vehicles to return (optional)
+
         Returns:
             List of vehicles
         """
-        return self.db.query(Vehicle).join(User).all()
+        # Owner columns come from the same JOIN; any other relationship access
+        # raises instead of silently issuing one query per vehicle.
+        query = self.db.query(Vehicle).join(Vehicle.owner).options(
+            contains_eager(Vehicle.owner),
+            raiseload("*"),
+        )
+
+        if vehicle_id:
+            query = query.filter(Vehicle.id == vehicle_id)
+
+        if limit:
+            query = query.limit(limit)
+
+        return query.all()
 
     def get_by_plate(self, plate_number: str, current_user: User) -> Vehicle:
         """
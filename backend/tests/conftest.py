@@ -1,16 +1,28 @@
+import os
+
+# app.main runs create_all on the app's own engine at import time. Point that
+# engine at a throwaway in-memory database before anything imports app, so
+# the suite never needs, or touches, the database in DATABASE_URL. Tests get
+# their sessions from the engine fixture below.
+os.environ["DATABASE_URL"] = "sqlite://"
+
 import pytest
 from datetime import datetime, timezone, timedelta
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, insert, make_url, select
+from sqlalchemy.orm import Session, configure_mappers, raiseload
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 from app.core.database import Base, get_db
 from app.core.config import settings
+from app.core.security import create_access_token, pwd_context
 from app.models import *
 from app.main import app
+from app.services import auth_service
 from tests.factories import (
-    ClientUserFactory, AdminUserFactory, InspectorUserFactory,
-    VehicleFactory, InspectorFactory, CheckItemTemplateFactory
+    ClientUserFactory, InspectorUserFactory,
+    VehicleFactory, InspectorFactory
 )
+from tests.helpers import make_user, unique_tag
 
 
 def utc_now():
@@ -18,30 +30,247 @@ def utc_now():
     return datetime.now(timezone.utc)
 
 
-@pytest.fixture(scope="function")
-def db_session():
-    """Create a MySQL test database for testing."""
-    engine = create_engine(settings.DATABASE_TEST_URL)
+def create_sqlite_memory_engine():
+    """
+    Return an engine for a private in-memory SQLite database.
+
+    StaticPool keeps the single connection alive, since closing it would drop
+    the database. pysqlite's own transaction handling breaks SAVEPOINTs, so
+    it is switched off and BEGIN is emitted by SQLAlchemy instead.
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    return engine
+
+
+def _test_database_url(config):
+    """
+    Return the test database URL for this process.
+
+    Under pytest-xdist every worker gets its own database, suffixed with the
+    worker id, so workers never drop or fill each other's tables.
+    """
+    url = make_url(settings.DATABASE_TEST_URL)
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None or not url.database:
+        return url
+
+    url = url.set(database=f"{url.database}_{workerinput['workerid']}")
+    server = create_engine(url.set(database=None))
+    with server.begin() as conn:
+        conn.exec_driver_sql(f"CREATE DATABASE IF NOT EXISTS `{url.database}`")
+    server.dispose()
+    return url
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _configured_mappers():
+    """
+    Resolve every mapper and relationship once, up front.
+
+    Otherwise the first query of the run pays for it, and that test looks
+    slow for reasons that have nothing to do with what it exercises.
+    """
+    configure_mappers()
+
+
+@pytest.fixture(autouse=True)
+def sent_emails(monkeypatch):
+    """
+    Keep every test off SMTP by recording password reset emails instead.
+
+    Returns the list of ``(email, token)`` pairs sent during the test.
+    """
+    sent = []
+    monkeypatch.setattr(
+        auth_service,
+        "send_password_reset_email",
+        lambda email, token: sent.append((email, token)),
+    )
+    return sent
+
+
+# Tests need hashes that round-trip through verify_password, not slow ones:
+# single-iteration PBKDF2 by default, with bcrypt at its minimum cost kept as
+# a second scheme so any bcrypt hash still verifies.
+_FAST_HASHING = dict(
+    schemes=["pbkdf2_sha256", "bcrypt"],
+    default="pbkdf2_sha256",
+    pbkdf2_sha256__rounds=1,
+    bcrypt__rounds=4,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    """Swap the production password context for the fast one for the whole run."""
+    production = pwd_context.to_dict()
+    pwd_context.update(**_FAST_HASHING)
+    yield production
+    pwd_context.load(production)
+
+
+@pytest.fixture
+def production_password_hashing(fast_password_hashing):
+    """Hash and verify with the production scheme for this one test."""
+    fast = pwd_context.to_dict()
+    pwd_context.load(fast_password_hashing)
+    yield
+    pwd_context.load(fast)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--mysql",
+        action="store_true",
+        help="run against DATABASE_TEST_URL instead of in-memory SQLite",
+    )
+
+
+@pytest.fixture(scope="session")
+def engine(request):
+    """
+    Create the test schema once for the whole run.
+
+    In-memory SQLite by default; ``--mysql`` runs the suite against the
+    MySQL test database instead.
+    """
+    if not request.config.getoption("--mysql"):
+        engine = create_sqlite_memory_engine()
+        Base.metadata.create_all(engine)
+        yield engine
+        engine.dispose()
+        return
+
+    engine = create_engine(_test_database_url(request.config))
     Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
 
-    SessionLocal = sessionmaker(bind=engine)
-    session = SessionLocal()
+    yield engine
+
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def connection(engine):
+    """
+    Open one connection per test module inside an outer transaction.
+
+    Module-scoped seed rows are written into this transaction, so they are
+    visible to every test in the module and disappear with the final ROLLBACK.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    yield connection
+
+    transaction.rollback()
+    connection.close()
+
+
+def _assert_module_level(connection):
+    """
+    Fail if a module seed is being inserted inside a test's SAVEPOINT.
+
+    That happens when a test is the first to reach a module-scoped seed
+    through getfixturevalue. The rows would be rolled back with the test
+    while pytest keeps the fixture cached, breaking every later test.
+    """
+    assert not connection.in_nested_transaction(), "module seed requested from inside a test"
+
+
+def _seed_rows(connection, *rows):
+    """Insert rows on the module connection so they outlive per-test rollbacks."""
+    _assert_module_level(connection)
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+        session.add_all(rows)
+        session.commit()
+
+
+@pytest.fixture(scope="function")
+def db_session(request, connection):
+    """
+    Provide a session whose work is rolled back after the test.
+
+    Each test runs inside a SAVEPOINT on the module connection and the session
+    turns its own commits into nested SAVEPOINT releases, so commit() calls in
+    tests, services and routes never reach the database and teardown is a
+    single ROLLBACK TO SAVEPOINT.
+
+    autoflush is off to match SessionLocal.
+
+    Under @pytest.mark.strict_loading every ORM SELECT gets raiseload("*"),
+    so a relationship the code did not load explicitly raises instead of
+    quietly issuing one query per row.
+    """
+    savepoint = connection.begin_nested()
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        autoflush=False,
+    )
+
+    if request.node.get_closest_marker("strict_loading"):
+        @event.listens_for(session, "do_orm_execute")
+        def _raiseload(orm_execute_state):
+            if orm_execute_state.is_select:
+                orm_execute_state.statement = orm_execute_state.statement.options(
+                    raiseload("*")
+                )
 
     yield session
 
     session.close()
-    Base.metadata.drop_all(engine)
-    engine.dispose()
+    savepoint.rollback()
+
+
+@pytest.fixture(scope="module")
+def _sample_user_id(connection):
+    """Insert the sample user once per module."""
+    user_id = generate_uuid()
+    _seed_rows(connection, ClientUserFactory.build(id=user_id))
+    return user_id
 
 
 @pytest.fixture
-def sample_user(db_session):
-    """Create a sample user for testing."""
-    user = ClientUserFactory.build()
-    db_session.add(user)
-    db_session.commit()
-    return user
+def sample_user(db_session, _sample_user_id):
+    """Return the sample user, loaded into this test's session."""
+    return db_session.get(User, _sample_user_id)
+
+
+@pytest.fixture(scope="module")
+def _other_vehicle_id(connection, _sample_user_id):
+    """Insert a vehicle owned by the sample user once per module."""
+    vehicle_id = generate_uuid()
+    _seed_rows(connection, Vehicle(
+        id=vehicle_id,
+        plate_number=unique_tag("OTHER"),
+        owner_id=_sample_user_id,
+        make="Honda",
+        model="Civic",
+        year=2021,
+    ))
+    return vehicle_id
+
+
+@pytest.fixture
+def other_vehicle(db_session, _other_vehicle_id):
+    """Return a vehicle that belongs to someone other than client_user."""
+    return db_session.get(Vehicle, _other_vehicle_id)
 
 
 @pytest.fixture
@@ -53,13 +282,28 @@ def sample_inspector_user(db_session):
     return user
 
 
+@pytest.fixture(scope="module")
+def _sample_inspector_id(connection):
+    """Insert an inspector user and its profile once per module."""
+    user_id = generate_uuid()
+    inspector_id = generate_uuid()
+    _seed_rows(
+        connection,
+        InspectorUserFactory.build(id=user_id),
+        InspectorFactory.build(id=inspector_id, user_id=user_id),
+    )
+    return inspector_id
+
+
 @pytest.fixture
-def sample_inspector(db_session, sample_inspector_user):
-    """Create a sample inspector profile for testing."""
-    inspector = InspectorFactory.build(user_id=sample_inspector_user.id)
-    db_session.add(inspector)
-    db_session.commit()
-    return inspector
+def sample_inspector(db_session, _sample_inspector_id):
+    """
+    Return the sample inspector profile, loaded into this test's session.
+
+    The profile has its own user, separate from sample_inspector_user, which
+    tests use to create inspector profiles of their own.
+    """
+    return db_session.get(Inspector, _sample_inspector_id)
 
 
 @pytest.fixture
@@ -71,86 +315,77 @@ def sample_vehicle(db_session, sample_user):
     return vehicle
 
 
+# The 8 standard check items, in ordinal order.
+STANDARD_CHECK_ITEMS = (
+    ("BRK", "Frenos"),
+    ("LGT", "Luces e indicadores"),
+    ("TIR", "Neumáticos"),
+    ("ENG", "Motor y fugas"),
+    ("STE", "Dirección"),
+    ("SUS", "Suspensión"),
+    ("EMI", "Emisiones"),
+    ("SAF", "Elementos de seguridad"),
+)
+
+
 @pytest.fixture
 def sample_check_templates(db_session):
     """Create the 8 standard check item templates."""
-    templates_data = [
-        ("BRK", "Frenos"),
-        ("LGT", "Luces e indicadores"),
-        ("TIR", "Neumáticos"),
-        ("ENG", "Motor y fugas"),
-        ("STE", "Dirección"),
-        ("SUS", "Suspensión"),
-        ("EMI", "Emisiones"),
-        ("SAF", "Elementos de seguridad"),
+    rows = [
+        {"id": generate_uuid(), "code": code, "description": desc, "ordinal": idx}
+        for idx, (code, desc) in enumerate(STANDARD_CHECK_ITEMS, start=1)
     ]
+    db_session.execute(insert(CheckItemTemplate), rows)
+    db_session.commit()
+    return _load_templates(db_session, [row["id"] for row in rows])
 
-    templates = []
-    for idx, (code, desc) in enumerate(templates_data, start=1):
-        template = CheckItemTemplateFactory.build(
-            code=code,
-            description=desc,
-            ordinal=idx,
-        )
-        db_session.add(template)
-        templates.append(template)
 
-    db_session.commit()
-    return templates
+def _load_templates(db_session, template_ids):
+    """Fetch check item templates by id in one query, ordered by ordinal."""
+    return db_session.scalars(
+        select(CheckItemTemplate)
+        .where(CheckItemTemplate.id.in_(template_ids))
+        .order_by(CheckItemTemplate.ordinal)
+    ).all()
 
 
-@pytest.fixture
-def client_user(db_session):
-    """Create a client user for testing."""
-    from app.core.security import get_password_hash
-    user = ClientUserFactory.build(
-        name="Client User",
-        password_hash=get_password_hash("password")
-    )
-    db_session.add(user)
-    db_session.commit()
-    return user
+@pytest.fixture(scope="module")
+def _check_template_ids(connection):
+    """Insert the 8 standard check item templates once per module."""
+    _assert_module_level(connection)
+    rows = [
+        {"id": generate_uuid(), "code": code, "description": desc, "ordinal": idx}
+        for idx, (code, desc) in enumerate(STANDARD_CHECK_ITEMS, start=1)
+    ]
+    connection.execute(insert(CheckItemTemplate), rows)
+    return [row["id"] for row in rows]
 
 
 @pytest.fixture
-def admin_user(db_session):
-    """Create an admin user for testing."""
-    from app.core.security import get_password_hash
-    user = AdminUserFactory.build(
-        name="Admin User",
-        password_hash=get_password_hash("password")
-    )
-    db_session.add(user)
-    db_session.commit()
-    return user
+def check_templates(db_session, _check_template_ids):
+    """Return the standard check item templates, loaded into this test's session."""
+    return _load_templates(db_session, _check_template_ids)
 
 
-@pytest.fixture
-def inspector_user(db_session):
-    """Create an inspector user for testing."""
-    from app.core.security import get_password_hash
-    user = InspectorUserFactory.build(
-        name="Inspector User",
-        password_hash=get_password_hash("password")
-    )
-    db_session.add(user)
-    db_session.commit()
-    return user
+# Fixed ids for the role users so their JWTs can be signed once at import
+# instead of per test.
+CLIENT_USER_ID = "fixture-client-user"
+ADMIN_USER_ID = "fixture-admin-user"
+INSPECTOR_USER_ID = "fixture-inspector-user"
 
+_TOKEN_TTL = timedelta(days=1)
+_CLIENT_TOKEN = create_access_token({"sub": CLIENT_USER_ID}, expires_delta=_TOKEN_TTL)
+_ADMIN_TOKEN = create_access_token({"sub": ADMIN_USER_ID}, expires_delta=_TOKEN_TTL)
+_INSPECTOR_TOKEN = create_access_token({"sub": INSPECTOR_USER_ID}, expires_delta=_TOKEN_TTL)
 
-@pytest.fixture
-def client_token(client, db_session, client_user):
-    """Create an auth token for the client user."""
-    from datetime import timedelta
-    from app.core.security import create_access_token
-    from app.core.config import settings
-    token = create_access_token({"sub": client_user.id, "email": client_user.email})
-    # Create session
+
+def _create_user_session(db_session, user_id, token):
+    """Persist an active session so get_current_user accepts the token."""
     session = UserSession(
         id=generate_uuid(),
-        user_id=client_user.id,
+        user_id=user_id,
         token=token,
-        expires_at=datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        expires_at=datetime.now(timezone.utc) + _TOKEN_TTL,
         revoked_at=None,
     )
     db_session.add(session)
@@ -158,44 +393,64 @@ def client_token(client, db_session, client_user):
     return token
 
 
+# The role users are inserted once per module. Tests that change them do so
+# inside their own SAVEPOINT, so every test starts from the same rows.
+@pytest.fixture(scope="module")
+def _client_user_row(connection):
+    _seed_rows(connection, User(**make_user(
+        id=CLIENT_USER_ID, name="Client User", email="client-user@test.com", role=UserRole.CLIENT
+    )))
+
+
+@pytest.fixture(scope="module")
+def _admin_user_row(connection):
+    _seed_rows(connection, User(**make_user(
+        id=ADMIN_USER_ID, name="Admin User", email="admin-user@test.com", role=UserRole.ADMIN
+    )))
+
+
+@pytest.fixture(scope="module")
+def _inspector_user_row(connection):
+    _seed_rows(connection, User(**make_user(
+        id=INSPECTOR_USER_ID, name="Inspector User", email="inspector-user@test.com",
+        role=UserRole.INSPECTOR
+    )))
+
+
+@pytest.fixture
+def client_user(db_session, _client_user_row):
+    """Return the client user, loaded into this test's session."""
+    return db_session.get(User, CLIENT_USER_ID)
+
+
+@pytest.fixture
+def admin_user(db_session, _admin_user_row):
+    """Return the admin user, loaded into this test's session."""
+    return db_session.get(User, ADMIN_USER_ID)
+
+
+@pytest.fixture
+def inspector_user(db_session, _inspector_user_row):
+    """Return the inspector user, loaded into this test's session."""
+    return db_session.get(User, INSPECTOR_USER_ID)
+
+
+@pytest.fixture
+def client_token(client, db_session, client_user):
+    """Return the pre-signed auth token for the client user."""
+    return _create_user_session(db_session, client_user.id, _CLIENT_TOKEN)
+
+
 @pytest.fixture
 def admin_token(client, db_session, admin_user):
-    """Create an auth token for the admin user."""
-    from datetime import timedelta
-    from app.core.security import create_access_token
-    from app.core.config import settings
-    token = create_access_token({"sub": admin_user.id, "email": admin_user.email})
-    # Create session
-    session = UserSession(
-        id=generate_uuid(),
-        user_id=admin_user.id,
-        token=token,
-        expires_at=datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
-        revoked_at=None,
-    )
-    db_session.add(session)
-    db_session.commit()
-    return token
+    """Return the pre-signed auth token for the admin user."""
+    return _create_user_session(db_session, admin_user.id, _ADMIN_TOKEN)
 
 
 @pytest.fixture
 def inspector_token(client, db_session, inspector_user):
-    """Create an auth token for the inspector user."""
-    from datetime import timedelta
-    from app.core.security import create_access_token
-    from app.core.config import settings
-    token = create_access_token({"sub": inspector_user.id, "email": inspector_user.email})
-    # Create session
-    session = UserSession(
-        id=generate_uuid(),
-        user_id=inspector_user.id,
-        token=token,
-        expires_at=datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
-        revoked_at=None,
-    )
-    db_session.add(session)
-    db_session.commit()
-    return token
+    """Return the pre-signed auth token for the inspector user."""
+    return _create_user_session(db_session, inspector_user.id, _INSPECTOR_TOKEN)
 
 
 @pytest.fixture
@@ -203,10 +458,97 @@ def client_vehicle(db_session, client_user):
     """Create a vehicle owned by client_user"""
     vehicle = VehicleFactory.build(owner_id=client_user.id)
     db_session.add(vehicle)
-    db_session.commit()
+    # Flush rather than commit, so client_user and friends are not expired
+    db_session.flush()
     return vehicle
 
 
+@pytest.fixture
+def make_user_row(db_session):
+    """
+    Return a factory that adds a user built from helpers.make_user.
+
+    Every user gets a fresh id and a unique email; keyword arguments override
+    any column, and ``password`` hashes a password of the test's choosing
+    instead of reusing the shared hash.
+    """
+    def _make(**overrides):
+        user = User(**make_user(**{
+            "id": generate_uuid(),
+            "email": f"{unique_tag('user')}@test.com",
+            **overrides,
+        }))
+        db_session.add(user)
+        db_session.flush()
+        return user
+
+    return _make
+
+
+@pytest.fixture
+def make_inspection(db_session):
+    """
+    Return a factory that adds an annual inspection for a vehicle.
+
+    Defaults to a pending inspection for the current year; keyword arguments
+    override any column. Rows are flushed, not committed, since the test's
+    SAVEPOINT is rolled back afterwards anyway.
+    """
+    def _make(vehicle, **overrides):
+        values = dict(
+            id=generate_uuid(),
+            vehicle_id=vehicle.id,
+            year=datetime.now().year,
+            status=AnnualStatus.PENDING,
+            attempt_count=0,
+        )
+        values.update(overrides)
+        inspection = AnnualInspection(**values)
+        db_session.add(inspection)
+        db_session.flush()
+        return inspection
+
+    return _make
+
+
+@pytest.fixture
+def make_appointment(db_session, sample_inspector):
+    """
+    Return a factory for an appointment on ``vehicle`` booked by ``created_by``.
+
+    A pending annual inspection for the current year goes in with it, in the
+    same flush. The appointment is for tomorrow and assigned to
+    sample_inspector; ``status`` defaults to CONFIRMED and keyword arguments
+    override any other column.
+    """
+    def _make(vehicle, created_by, status=AppointmentStatus.CONFIRMED, **overrides):
+        annual = AnnualInspection(
+            id=generate_uuid(),
+            vehicle_id=vehicle.id,
+            year=datetime.now().year,
+            status=AnnualStatus.PENDING,
+            attempt_count=0,
+        )
+        fields = dict(
+            id=generate_uuid(),
+            annual_inspection_id=annual.id,
+            vehicle_id=vehicle.id,
+            inspector_id=sample_inspector.id,
+            created_by_user_id=created_by.id,
+            created_channel=CreatedChannel.CLIENT_PORTAL,
+            date_time=utc_now() + timedelta(days=1),
+            status=status,
+            confirmation_token=unique_tag("CONF"),
+        )
+        fields.update(overrides)
+        appointment = Appointment(**fields)
+        db_session.add_all([annual, appointment])
+        db_session.flush()
+        return appointment
+
+    return _make
+
+
 @pytest.fixture
 def client(db_session):
     """Create a test client with overridden database dependency."""
@@ -217,6 +559,8 @@ def client(db_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
-    test_client = TestClient(app)
-    yield test_client
+    # Entering the client keeps one event-loop portal open for every request
+    # in the test, instead of starting a new one per call.
+    with TestClient(app) as test_client:
+        yield test_client
     app.dependency_overrides.clear()
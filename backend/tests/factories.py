@@ -9,6 +9,7 @@ from app.models import (
     AvailabilitySlot, InspectionResult, CheckItemTemplate, ItemCheck,
     generate_uuid
 )
+from tests.helpers import unique_tag
 
 fake = Faker()
 
@@ -64,7 +65,7 @@ class InspectorFactory(factory.Factory):
 
     id = factory.LazyFunction(generate_uuid)
     user_id = factory.LazyFunction(generate_uuid)
-    employee_id = factory.LazyAttribute(lambda obj: f"INS-{fake.uuid4()[:8].upper()}")
+    employee_id = factory.LazyFunction(lambda: unique_tag("INS"))
     active = True
 
 
@@ -0,0 +1,97 @@
+"""Shared helpers for building test data."""
+import itertools
+import os
+from contextlib import contextmanager
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import raiseload
+
+from passlib.hash import pbkdf2_sha256
+
+from app.core.security import get_password_hash
+from app.models import UserRole
+
+# Every seeded user shares this password, so it is hashed once per run. It
+# uses the single-round PBKDF2 that conftest's fast_password_hashing fixture
+# makes the default, so verify_password accepts it during tests.
+PASSWORD_HASH = pbkdf2_sha256.using(rounds=1).hash("password")
+
+_PID = f"{os.getpid():x}"
+_tag_counter = itertools.count(1)
+
+
+def unique_tag(prefix: str) -> str:
+    """
+    Return a value such as ``CONF-3f2a-00002a`` for plates, tokens and employee ids.
+
+    The process id keeps pytest-xdist workers apart and the counter keeps
+    values unique within a worker, without building a UUID to slice.
+    """
+    return f"{prefix}-{_PID}-{next(_tag_counter):06x}"
+
+
+def make_user(password=None, **overrides):
+    """
+    Return the column values for a User row, ready for insert(User) or User(**...).
+
+    Users share the pre-hashed PASSWORD_HASH unless ``password`` is given,
+    in which case that password is hashed for this user.
+    """
+    values = {
+        "id": "test-user",
+        "name": "Test User",
+        "email": "test@example.com",
+        "password_hash": PASSWORD_HASH,
+        "role": UserRole.CLIENT,
+        "is_active": True,
+    }
+    if password is not None:
+        values["password_hash"] = get_password_hash(password)
+    values.update(overrides)
+    return values
+
+
+@contextmanager
+def count_queries(session):
+    """Collect the SQL statements the session's connection runs inside the block."""
+    queries = []
+    connection = session.connection()
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(connection, "before_cursor_execute", _record)
+    try:
+        yield queries
+    finally:
+        event.remove(connection, "before_cursor_execute", _record)
+
+
+def assert_http_error(fn, status_code, detail=None):
+    """Call fn and assert it raises an HTTPException with the given status and detail."""
+    with pytest.raises(HTTPException) as exc_info:
+        fn()
+
+    assert exc_info.value.status_code == status_code
+    if detail is not None:
+        assert detail in exc_info.value.detail
+
+
+def assert_no_lazy_loads(session, obj, attrs):
+    """
+    Reload obj with raiseload("*") and read attrs from it.
+
+    Any attribute that would need a lazy load raises InvalidRequestError,
+    so passing a response schema's fields guards serialization against N+1s.
+    """
+    reloaded = session.get(
+        type(obj),
+        inspect(obj).identity,
+        options=[raiseload("*")],
+        populate_existing=True,
+    )
+    for attr in attrs:
+        getattr(reloaded, attr)
+    return reloaded
@@ -1,5 +1,6 @@
 """Tests for annual inspection endpoints."""
 import pytest
+from datetime import datetime
 from app.models import User, Vehicle, AnnualInspection, generate_uuid, AnnualStatus, UserRole
 from app.core.security import get_password_hash
 from tests.factories import VehicleFactory, AnnualInspectionFactory, ClientUserFactory
@@ -21,7 +22,8 @@ class TestAnnualInspectionRoutes:
 
         inspection_data = {
             "vehicle_id": vehicle.id,
-            "year": 2024
+            # The schema only accepts the current year plus or minus one
+            "year": datetime.now().year
         }
 
         response = client.post(
@@ -33,7 +35,7 @@ class TestAnnualInspectionRoutes:
         assert response.status_code == 201
         data = response.json()
         assert data["vehicle_id"] == vehicle.id
-        assert data["year"] == 2024
+        assert data["year"] == inspection_data["year"]
         assert data["status"] == "PENDING"
 
     def test_list_annual_inspections_with_pagination(self, client, db_session, client_token):
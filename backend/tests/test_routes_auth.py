@@ -128,7 +128,7 @@ class TestAuthRoutes:
         )
         assert response.status_code == 401
 
-    def test_forgot_password_endpoint(self, client, db_session, monkeypatch):
+    def test_forgot_password_endpoint(self, client, db_session):
         """Test forgot password endpoint."""
         user = User(
             id="test-user",
@@ -140,13 +140,6 @@ class TestAuthRoutes:
         db_session.add(user)
         db_session.commit()
 
-        # Mock email sending
-        def mock_send_email(*args, **kwargs):
-            pass
-
-        from app.services import auth_service
-        monkeypatch.setattr(auth_service, "send_password_reset_email", mock_send_email)
-
         response = client.post("/api/v1/auth/forgot-password", json={
             "email": "test@example.com"
         })
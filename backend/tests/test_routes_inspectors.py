@@ -1,7 +1,30 @@
 """Tests for inspector endpoints."""
 import pytest
-from app.models import User, Inspector, generate_uuid
-from app.core.security import get_password_hash
+from sqlalchemy import insert
+from app.models import User, UserRole, Inspector, generate_uuid
+from tests.conftest import _seed_rows
+from tests.helpers import make_user
+
+
+@pytest.fixture(scope="module")
+def seeded_inspector(connection):
+    """
+    Insert the inspector user + profile shared by the get/update/delete tests, once per module.
+
+    The employee id and email differ from the ones the create and list tests
+    insert, so those tests don't collide with this row.
+    """
+    _seed_rows(
+        connection,
+        User(**make_user(
+            id="seeded-inspector-user",
+            name="Inspector",
+            email="seeded-insp@test.com",
+            role=UserRole.INSPECTOR,
+        )),
+        Inspector(id="test-inspector", user_id="seeded-inspector-user", employee_id="EMP100"),
+    )
+    return "test-inspector"
 
 
 class TestInspectorRoutes:
@@ -15,19 +38,17 @@ class TestInspectorRoutes:
     def test_create_inspector(self, client, db_session, admin_token):
         """Test inspector creation."""
         # Create inspector user
-        user = User(
+        db_session.execute(insert(User), [make_user(
             id="inspector-user-id",
             name="Inspector User",
             email="inspector@example.com",
-            password_hash=get_password_hash("password123"),
             role="INSPECTOR",
-            is_active=True
-        )
-        db_session.add(user)
+            is_active=True,
+        )])
         db_session.commit()
 
         inspector_data = {
-            "user_id": user.id,
+            "user_id": "inspector-user-id",
             "employee_id": "EMP001"
         }
 
@@ -40,25 +61,23 @@ class TestInspectorRoutes:
         assert response.status_code == 201
         data = response.json()
         assert data["employee_id"] == "EMP001"
-        assert data["user_id"] == user.id
+        assert data["user_id"] == "inspector-user-id"
 
     def test_list_inspectors(self, client, db_session, admin_token):
         """Test listing inspectors with pagination."""
         # Create inspector
-        user = User(
+        db_session.execute(insert(User), [make_user(
             id="inspector-user",
             name="Inspector",
             email="insp@test.com",
-            password_hash=get_password_hash("pass"),
-            role="INSPECTOR"
-        )
-        inspector = Inspector(
-            id="insp-1",
-            user_id=user.id,
-            employee_id="EMP001",
-            active=True
-        )
-        db_session.add_all([user, inspector])
+            role="INSPECTOR",
+        )])
+        db_session.execute(insert(Inspector), [{
+            "id": "insp-1",
+            "user_id": "inspector-user",
+            "employee_id": "EMP001",
+            "active": True,
+        }])
         db_session.commit()
 
         response = client.get(
@@ -71,23 +90,8 @@ class TestInspectorRoutes:
         assert "inspectors" in data
         assert "total" in data
 
-    def test_get_inspector_by_id(self, client, db_session, admin_token):
+    def test_get_inspector_by_id(self, client, admin_token, seeded_inspector):
         """Test get inspector by ID."""
-        user = User(
-            id="inspector-user",
-            name="Inspector",
-            email="insp@test.com",
-            password_hash=get_password_hash("pass"),
-            role="INSPECTOR"
-        )
-        inspector = Inspector(
-            id="test-inspector",
-            user_id=user.id,
-            employee_id="EMP001"
-        )
-        db_session.add_all([user, inspector])
-        db_session.commit()
-
         response = client.get(
             "/api/v1/inspectors/test-inspector",
             headers={"Authorization": f"Bearer {admin_token}"}
@@ -96,25 +100,10 @@ class TestInspectorRoutes:
         assert response.status_code == 200
         data = response.json()
         assert data["id"] == "test-inspector"
-        assert data["employee_id"] == "EMP001"
+        assert data["employee_id"] == "EMP100"
 
-    def test_update_inspector(self, client, db_session, admin_token):
+    def test_update_inspector(self, client, admin_token, seeded_inspector):
         """Test inspector update."""
-        user = User(
-            id="inspector-user",
-            name="Inspector",
-            email="insp@test.com",
-            password_hash=get_password_hash("pass"),
-            role="INSPECTOR"
-        )
-        inspector = Inspector(
-            id="test-inspector",
-            user_id=user.id,
-            employee_id="EMP001"
-        )
-        db_session.add_all([user, inspector])
-        db_session.commit()
-
         update_data = {"employee_id": "EMP002"}
 
         response = client.put(
@@ -127,23 +116,8 @@ class TestInspectorRoutes:
         data = response.json()
         assert data["employee_id"] == "EMP002"
 
-    def test_delete_inspector(self, client, db_session, admin_token):
+    def test_delete_inspector(self, client, admin_token, seeded_inspector):
         """Test inspector deletion."""
-        user = User(
-            id="inspector-user",
-            name="Inspector",
-            email="insp@test.com",
-            password_hash=get_password_hash("pass"),
-            role="INSPECTOR"
-        )
-        inspector = Inspector(
-            id="test-inspector",
-            user_id=user.id,
-            employee_id="EMP001"
-        )
-        db_session.add_all([user, inspector])
-        db_session.commit()
-
         response = client.delete(
             "/api/v1/inspectors/test-inspector",
             headers={"Authorization": f"Bearer {admin_token}"}
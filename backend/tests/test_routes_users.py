@@ -1,7 +1,8 @@
 """Tests for user endpoints."""
 import pytest
+from sqlalchemy import insert
 from app.models import User
-from app.core.security import get_password_hash
+from tests.helpers import make_user
 
 
 class TestUserRoutes:
@@ -91,14 +92,7 @@ class TestUserRoutes:
 
     def test_admin_get_user_by_id(self, client, db_session, admin_token):
         """Test admin get user by ID."""
-        user = User(
-            id="test-user",
-            name="Test User",
-            email="test@example.com",
-            password_hash=get_password_hash("pass"),
-            role="CLIENT"
-        )
-        db_session.add(user)
+        db_session.execute(insert(User), [make_user()])
         db_session.commit()
 
         response = client.get(
@@ -112,14 +106,7 @@ class TestUserRoutes:
 
     def test_admin_update_user(self, client, db_session, admin_token):
         """Test admin updating user."""
-        user = User(
-            id="test-user",
-            name="Test User",
-            email="test@example.com",
-            password_hash=get_password_hash("pass"),
-            role="CLIENT"
-        )
-        db_session.add(user)
+        db_session.execute(insert(User), [make_user()])
         db_session.commit()
 
         update_data = {"name": "Updated Name", "role": "INSPECTOR"}
@@ -136,14 +123,7 @@ class TestUserRoutes:
 
     def test_admin_delete_user(self, client, db_session, admin_token):
         """Test admin deleting user."""
-        user = User(
-            id="test-user",
-            name="Test User",
-            email="test@example.com",
-            password_hash=get_password_hash("pass"),
-            role="CLIENT"
-        )
-        db_session.add(user)
+        db_session.execute(insert(User), [make_user()])
         db_session.commit()
 
         response = client.delete(
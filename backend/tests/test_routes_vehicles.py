@@ -1,5 +1,6 @@
 import pytest
 from app.models import Vehicle
+from app.routes.vehicles import VEHICLE_DELETED_MESSAGE
 from tests.factories import VehicleFactory
 
 
@@ -140,7 +141,7 @@ class TestVehicleRoutes:
         )
 
         assert response.status_code == 200
-        assert "eliminado exitosamente" in response.json()["message"]
+        assert response.json() == {"message": VEHICLE_DELETED_MESSAGE}
 
     def test_get_vehicles_with_owners(self, client, client_user, admin_token, db_session):
         """Test admin endpoint for vehicles with owner details."""
@@ -162,3 +163,47 @@ class TestVehicleRoutes:
         assert len(data) >= 1
         vehicle_data = next(v for v in data if v["id"] == "test-vehicle")
         assert vehicle_data["owner_name"] == "Client User"
+
+    def test_get_vehicles_with_owners_by_vehicle_id(self, client, client_user, admin_token, db_session):
+        """Test that vehicle_id narrows the owner listing to one vehicle."""
+        db_session.add_all([
+            VehicleFactory.build(id="test-vehicle", plate_number="TEST123", owner_id=client_user.id),
+            VehicleFactory.build(id="other-vehicle", plate_number="TEST456", owner_id=client_user.id),
+        ])
+        db_session.commit()
+
+        response = client.get(
+            "/api/v1/vehicles/with-owners?vehicle_id=test-vehicle",
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        assert data[0]["id"] == "test-vehicle"
+        assert data[0]["owner_name"] == "Client User"
+
+    def test_get_vehicles_with_owners_limit(self, client, client_user, admin_token, db_session):
+        """Test that limit caps the number of vehicles returned."""
+        db_session.add_all([
+            VehicleFactory.build(owner_id=client_user.id) for _ in range(3)
+        ])
+        db_session.commit()
+
+        response = client.get(
+            "/api/v1/vehicles/with-owners?limit=2",
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+
+        assert response.status_code == 200
+        assert len(response.json()) == 2
+
+    @pytest.mark.parametrize("limit", [0, 101])
+    def test_get_vehicles_with_owners_limit_out_of_range(self, client, admin_token, limit):
+        """Test that limit outside 1..100 is rejected."""
+        response = client.get(
+            f"/api/v1/vehicles/with-owners?limit={limit}",
+            headers={"Authorization": f"Bearer {admin_token}"}
+        )
+
+        assert response.status_code == 422
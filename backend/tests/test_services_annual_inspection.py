@@ -1,109 +1,114 @@
 import pytest
 from datetime import datetime, timezone, timedelta
 from fastapi import HTTPException
+from sqlalchemy import delete, insert
 from sqlalchemy.orm import Session
 from app.services.annual_inspection_service import AnnualInspectionService
 from app.models import (
     User,
-    UserRole,
     Vehicle,
+    Inspector,
     AnnualInspection,
     AnnualStatus,
     Appointment,
     AppointmentStatus,
     CreatedChannel,
-    Inspector,
     generate_uuid,
 )
 from app.schemas.annual_inspection import (
     AnnualInspectionCreate,
     AnnualInspectionUpdate,
 )
+from tests.conftest import CLIENT_USER_ID
+from tests.helpers import count_queries, unique_tag
 
+# Read once so every test agrees on the year, even across New Year's Eve.
+CURRENT_YEAR = datetime.now().year
 
-class TestAnnualInspectionServiceCreate:
-    """Test the create service method."""
 
-    def test_client_can_create_for_own_vehicle(
-        self,
-        db_session: Session,
-        client_user: User,
-        client_vehicle: Vehicle
-    ):
-        """Client can create annual inspection for their own vehicle."""
-        service = AnnualInspectionService(db_session)
-        data = AnnualInspectionCreate(
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year
-        )
+def _delete_vehicle_rows(connection, vehicle_id):
+    """
+    Delete a class-seeded vehicle and its inspections.
 
-        result = service.create(data, client_user)
+    Class-level rows are removed explicitly rather than with a class-level
+    SAVEPOINT: module-scoped seeds first requested inside the class would
+    otherwise be rolled back with it while pytest still has them cached.
+    """
+    connection.execute(delete(AnnualInspection).where(AnnualInspection.vehicle_id == vehicle_id))
+    connection.execute(delete(Vehicle).where(Vehicle.id == vehicle_id))
 
-        assert result.vehicle_id == client_vehicle.id
-        assert result.year == datetime.now().year
-        assert result.status == AnnualStatus.PENDING
-        assert result.attempt_count == 0
 
-    def test_admin_can_create_for_any_vehicle(
-        self,
-        db_session: Session,
-        admin_user: User,
-        client_vehicle: Vehicle
-    ):
-        """Admin can create annual inspection for any vehicle."""
-        service = AnnualInspectionService(db_session)
-        data = AnnualInspectionCreate(
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year
-        )
+@pytest.fixture
+def service(db_session: Session) -> AnnualInspectionService:
+    """Annual inspection service bound to this test's session."""
+    return AnnualInspectionService(db_session)
 
-        result = service.create(data, admin_user)
 
-        assert result.vehicle_id == client_vehicle.id
-        assert result.status == AnnualStatus.PENDING
+class TestAnnualInspectionServiceCreate:
+    """Test the create service method."""
 
-    def test_inspector_cannot_create(
+    @pytest.fixture
+    def user(self, request, client_user: User, admin_user: User, inspector_user: User) -> User:
+        """
+        Return the role user named by the test parameter.
+
+        Requested in the signature, not via getfixturevalue, so the
+        module-scoped seeds are not first set up inside this test's SAVEPOINT.
+        """
+        return {
+            "client_user": client_user,
+            "admin_user": admin_user,
+            "inspector_user": inspector_user,
+        }[request.param]
+
+    @pytest.mark.parametrize(
+        "user,expected",
+        [
+            ("client_user", None),
+            ("admin_user", None),
+            ("inspector_user", (403, "inspectores no pueden crear")),
+        ],
+        indirect=["user"],
+    )
+    def test_create_by_role(
         self,
-        db_session: Session,
-        inspector_user: User,
+        service: AnnualInspectionService,
+        user: User,
+        expected,
         client_vehicle: Vehicle
     ):
-        """Inspector cannot create annual inspections."""
-        service = AnnualInspectionService(db_session)
+        """Clients and admins can create inspections, inspectors cannot."""
         data = AnnualInspectionCreate(
             vehicle_id=client_vehicle.id,
-            year=datetime.now().year
+            year=CURRENT_YEAR
         )
 
-        with pytest.raises(HTTPException) as exc_info:
-            service.create(data, inspector_user)
+        if expected is not None:
+            with pytest.raises(HTTPException) as exc_info:
+                service.create(data, user)
 
-        assert exc_info.value.status_code == 403
-        assert "inspectores no pueden crear" in exc_info.value.detail.lower()
+            status_code, detail = expected
+            assert exc_info.value.status_code == status_code
+            assert detail in exc_info.value.detail.lower()
+            return
+
+        result = service.create(data, user)
+
+        assert result.vehicle_id == client_vehicle.id
+        assert result.year == CURRENT_YEAR
+        assert result.status == AnnualStatus.PENDING
+        assert result.attempt_count == 0
 
     def test_client_cannot_create_for_other_vehicle(
         self,
-        db_session: Session,
+        service: AnnualInspectionService,
         client_user: User,
-        sample_user: User
+        other_vehicle: Vehicle
     ):
         """Client cannot create inspection for other user's vehicle."""
-        # Create vehicle owned by sample_user
-        other_vehicle = Vehicle(
-            id=generate_uuid(),
-            plate_number=f"OTHER-{generate_uuid()[:8]}",
-            owner_id=sample_user.id,
-            make="Honda",
-            model="Civic",
-            year=2021,
-        )
-        db_session.add(other_vehicle)
-        db_session.commit()
-
-        service = AnnualInspectionService(db_session)
         data = AnnualInspectionCreate(
             vehicle_id=other_vehicle.id,
-            year=datetime.now().year
+            year=CURRENT_YEAR
         )
 
         with pytest.raises(HTTPException) as exc_info:
@@ -114,14 +119,13 @@ class TestAnnualInspectionServiceCreate:
 
     def test_cannot_create_for_nonexistent_vehicle(
         self,
-        db_session: Session,
+        service: AnnualInspectionService,
         client_user: User
     ):
         """Cannot create inspection for non-existent vehicle."""
-        service = AnnualInspectionService(db_session)
         data = AnnualInspectionCreate(
             vehicle_id=generate_uuid(),
-            year=datetime.now().year
+            year=CURRENT_YEAR
         )
 
         with pytest.raises(HTTPException) as exc_info:
@@ -132,20 +136,18 @@ class TestAnnualInspectionServiceCreate:
 
     def test_cannot_create_duplicate(
         self,
-        db_session: Session,
+        service: AnnualInspectionService,
+        make_inspection,
         client_user: User,
         client_vehicle: Vehicle
     ):
         """Cannot create duplicate inspection for same vehicle and year."""
-        # Create first inspection
-        service = AnnualInspectionService(db_session)
+        make_inspection(client_vehicle, year=CURRENT_YEAR)
         data = AnnualInspectionCreate(
             vehicle_id=client_vehicle.id,
-            year=datetime.now().year
+            year=CURRENT_YEAR
         )
-        service.create(data, client_user)
 
-        # Try to create duplicate
         with pytest.raises(HTTPException) as exc_info:
             service.create(data, client_user)
 
@@ -158,45 +160,16 @@ class TestAnnualInspectionServiceList:
 
     def test_client_sees_only_own_inspections(
         self,
-        db_session: Session,
+        service: AnnualInspectionService,
+        make_inspection,
         client_user: User,
         client_vehicle: Vehicle,
-        sample_user: User
+        other_vehicle: Vehicle
     ):
         """Client can only see inspections for their own vehicles."""
-        # Create inspection for client
-        client_inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(client_inspection)
-
-        # Create vehicle and inspection for another user
-        other_vehicle = Vehicle(
-            id=generate_uuid(),
-            plate_number=f"OTHER-{generate_uuid()[:8]}",
-            owner_id=sample_user.id,
-            make="Honda",
-            model="Civic",
-            year=2021,
-        )
-        db_session.add(other_vehicle)
-        db_session.commit()
+        client_inspection = make_inspection(client_vehicle)
+        make_inspection(other_vehicle)
 
-        other_inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=other_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(other_inspection)
-        db_session.commit()
-
-        service = AnnualInspectionService(db_session)
         inspections, total = service.list(client_user)
 
         assert total == 1
@@ -206,203 +179,164 @@ class TestAnnualInspectionServiceList:
     def test_admin_sees_all_inspections(
         self,
         db_session: Session,
+        service: AnnualInspectionService,
+        make_inspection,
         admin_user: User,
         client_vehicle: Vehicle,
-        sample_user: User
+        other_vehicle: Vehicle
     ):
         """Admin can see all inspections."""
-        # Create inspection for client
-        client_inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(client_inspection)
-
-        # Create vehicle and inspection for another user
-        other_vehicle = Vehicle(
-            id=generate_uuid(),
-            plate_number=f"OTHER-{generate_uuid()[:8]}",
-            owner_id=sample_user.id,
-            make="Honda",
-            model="Civic",
-            year=2021,
-        )
-        db_session.add(other_vehicle)
-        db_session.commit()
-
-        other_inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=other_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(other_inspection)
-        db_session.commit()
+        make_inspection(client_vehicle)
+        make_inspection(other_vehicle)
 
-        service = AnnualInspectionService(db_session)
-        inspections, total = service.list(admin_user)
+        with count_queries(db_session) as queries:
+            inspections, total = service.list(admin_user)
 
         assert total == 2
         assert len(inspections) == 2
-
-    def test_filter_by_status(
+        # One COUNT plus one page query, no per-row lazy loads
+        assert len(queries) <= 2
+
+    @pytest.mark.parametrize(
+        "kwarg,attr,value",
+        [
+            ("status_filter", "status", AnnualStatus.PENDING),
+            ("year", "year", 2024),
+        ],
+    )
+    def test_filters(
         self,
-        db_session: Session,
+        service: AnnualInspectionService,
+        make_inspection,
         admin_user: User,
-        client_vehicle: Vehicle
+        client_vehicle: Vehicle,
+        kwarg: str,
+        attr: str,
+        value
     ):
-        """Can filter inspections by status."""
-        # Create pending inspection
-        pending = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=2024,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
+        """Can filter inspections by status and by year."""
+        make_inspection(client_vehicle, year=2024)
+        make_inspection(
+            client_vehicle, year=2023, status=AnnualStatus.PASSED, attempt_count=1
         )
-        db_session.add(pending)
 
-        # Create passed inspection
-        passed = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=2023,
-            status=AnnualStatus.PASSED,
-            attempt_count=1,
-        )
-        db_session.add(passed)
-        db_session.commit()
-
-        service = AnnualInspectionService(db_session)
-        inspections, total = service.list(admin_user, status_filter=AnnualStatus.PENDING)
+        inspections, total = service.list(admin_user, **{kwarg: value})
 
         assert total == 1
-        assert inspections[0].status == AnnualStatus.PENDING
-
-    def test_filter_by_year(
-        self,
-        db_session: Session,
-        admin_user: User,
-        client_vehicle: Vehicle
-    ):
-        """Can filter inspections by year."""
-        # Create inspections for different years
-        inspection_2024 = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=2024,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(inspection_2024)
-
-        inspection_2023 = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=2023,
-            status=AnnualStatus.PASSED,
-            attempt_count=1,
-        )
-        db_session.add(inspection_2023)
-        db_session.commit()
+        assert getattr(inspections[0], attr) == value
+
+
+class TestAnnualInspectionServicePagination:
+    """Test paging through the list service method."""
+
+    @pytest.fixture(scope="class")
+    def paginated_inspections(self, connection, _client_user_row):
+        """
+        Insert one vehicle with 5 inspections for the whole class.
+
+        The rows are deleted again when the class finishes so they don't leak
+        into the totals asserted by the other list tests in this module.
+        """
+        vehicle_id = generate_uuid()
+        connection.execute(insert(Vehicle), [dict(
+            id=vehicle_id,
+            plate_number=unique_tag("PAGE"),
+            owner_id=CLIENT_USER_ID,
+            make="Toyota",
+            model="Corolla",
+            year=2020,
+        )])
+        connection.execute(insert(AnnualInspection), [
+            dict(
+                id=generate_uuid(),
+                vehicle_id=vehicle_id,
+                year=2020 + i,
+                status=AnnualStatus.PENDING,
+                attempt_count=0,
+            )
+            for i in range(5)
+        ])
 
-        service = AnnualInspectionService(db_session)
-        inspections, total = service.list(admin_user, year=2024)
+        yield
 
-        assert total == 1
-        assert inspections[0].year == 2024
+        _delete_vehicle_rows(connection, vehicle_id)
 
+    @pytest.mark.parametrize("page,expected", [(1, 2), (2, 2), (3, 1)])
     def test_pagination_works(
         self,
+        paginated_inspections,
         db_session: Session,
+        service: AnnualInspectionService,
         admin_user: User,
-        client_vehicle: Vehicle
+        page: int,
+        expected: int
     ):
-        """Pagination works correctly."""
-        # Create 5 inspections
-        for i in range(5):
-            inspection = AnnualInspection(
-                id=generate_uuid(),
-                vehicle_id=client_vehicle.id,
-                year=2020 + i,
-                status=AnnualStatus.PENDING,
-                attempt_count=0,
-            )
-            db_session.add(inspection)
-        db_session.commit()
-
-        service = AnnualInspectionService(db_session)
+        """Each page holds page_size items and reports the full total."""
+        with count_queries(db_session) as queries:
+            inspections, total = service.list(admin_user, page=page, page_size=2)
 
-        # Get first page (2 items)
-        inspections, total = service.list(admin_user, page=1, page_size=2)
         assert total == 5
-        assert len(inspections) == 2
-
-        # Get second page (2 items)
-        inspections, total = service.list(admin_user, page=2, page_size=2)
-        assert total == 5
-        assert len(inspections) == 2
-
-
+        assert len(inspections) == expected
+        assert len(queries) <= 2
+
+
+@pytest.fixture(scope="class")
+def class_inspection(request, connection, _client_user_row):
+    """
+    Insert a pending inspection on a client vehicle once per test class.
+
+    The id is stored on the class as ``inspection_id``. Each test's own
+    SAVEPOINT undoes whatever the test does to the row, and the row is
+    deleted again when the class finishes.
+    """
+    vehicle_id = generate_uuid()
+    inspection_id = generate_uuid()
+    connection.execute(insert(Vehicle), [dict(
+        id=vehicle_id,
+        plate_number=unique_tag("CLS"),
+        owner_id=CLIENT_USER_ID,
+        make="Toyota",
+        model="Corolla",
+        year=2020,
+    )])
+    connection.execute(insert(AnnualInspection), [dict(
+        id=inspection_id,
+        vehicle_id=vehicle_id,
+        year=CURRENT_YEAR,
+        status=AnnualStatus.PENDING,
+        attempt_count=0,
+    )])
+    request.cls.inspection_id = inspection_id
+
+    yield
+
+    _delete_vehicle_rows(connection, vehicle_id)
+
+
+@pytest.mark.usefixtures("class_inspection")
 class TestAnnualInspectionServiceGet:
     """Test the get service method."""
 
     def test_client_can_access_own_inspection(
         self,
-        db_session: Session,
-        client_user: User,
-        client_vehicle: Vehicle
+        service: AnnualInspectionService,
+        client_user: User
     ):
         """Client can access inspection for their own vehicle."""
-        inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(inspection)
-        db_session.commit()
+        result = service.get(self.inspection_id, client_user)
 
-        service = AnnualInspectionService(db_session)
-        result = service.get(inspection.id, client_user)
-
-        assert result.id == inspection.id
+        assert result.id == self.inspection_id
 
     def test_client_cannot_access_other_inspection(
         self,
-        db_session: Session,
+        service: AnnualInspectionService,
+        make_inspection,
         client_user: User,
-        sample_user: User
+        other_vehicle: Vehicle
     ):
         """Client cannot access inspection for other user's vehicle."""
-        # Create vehicle for another user
-        other_vehicle = Vehicle(
-            id=generate_uuid(),
-            plate_number=f"OTHER-{generate_uuid()[:8]}",
-            owner_id=sample_user.id,
-            make="Honda",
-            model="Civic",
-            year=2021,
-        )
-        db_session.add(other_vehicle)
-        db_session.commit()
+        inspection = make_inspection(other_vehicle)
 
-        inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=other_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(inspection)
-        db_session.commit()
-
-        service = AnnualInspectionService(db_session)
         with pytest.raises(HTTPException) as exc_info:
             service.get(inspection.id, client_user)
 
@@ -411,119 +345,72 @@ class TestAnnualInspectionServiceGet:
     def test_admin_can_access_any_inspection(
         self,
         db_session: Session,
-        admin_user: User,
-        client_vehicle: Vehicle
-    ):
-        """Admin can access any inspection."""
-        inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(inspection)
-        db_session.commit()
-
-        service = AnnualInspectionService(db_session)
-        result = service.get(inspection.id, admin_user)
-
-        assert result.id == inspection.id
-
-    def test_get_nonexistent_inspection(
-        self,
-        db_session: Session,
+        service: AnnualInspectionService,
         admin_user: User
     ):
-        """Raises error when inspection doesn't exist."""
-        service = AnnualInspectionService(db_session)
-
-        with pytest.raises(HTTPException) as exc_info:
-            service.get(generate_uuid(), admin_user)
+        """Admin can access any inspection."""
+        with count_queries(db_session) as queries:
+            result = service.get(self.inspection_id, admin_user)
 
-        assert exc_info.value.status_code == 404
+        assert result.id == self.inspection_id
+        assert len(queries) <= 2
 
 
+@pytest.mark.usefixtures("class_inspection")
 class TestAnnualInspectionServiceUpdate:
     """Test the update service method."""
 
     def test_can_update_status(
         self,
-        db_session: Session,
-        admin_user: User,
-        client_vehicle: Vehicle
+        service: AnnualInspectionService,
+        admin_user: User
     ):
         """Can update inspection status."""
-        inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(inspection)
-        db_session.commit()
-
-        service = AnnualInspectionService(db_session)
         data = AnnualInspectionUpdate(status=AnnualStatus.PASSED)
-        result = service.update(inspection.id, data, admin_user)
+        result = service.update(self.inspection_id, data, admin_user)
 
         assert result.status == AnnualStatus.PASSED
 
-    def test_update_nonexistent_inspection(
-        self,
-        db_session: Session,
-        admin_user: User
-    ):
-        """Raises error when updating non-existent inspection."""
-        service = AnnualInspectionService(db_session)
-        data = AnnualInspectionUpdate(status=AnnualStatus.PASSED)
-
-        with pytest.raises(HTTPException) as exc_info:
-            service.update(generate_uuid(), data, admin_user)
-
-        assert exc_info.value.status_code == 404
-
 
+@pytest.mark.usefixtures("class_inspection")
 class TestAnnualInspectionServiceDelete:
     """Test the delete service method."""
 
     def test_can_delete_inspection(
         self,
         db_session: Session,
-        admin_user: User,
-        client_vehicle: Vehicle
+        service: AnnualInspectionService,
+        admin_user: User
     ):
         """Can delete an inspection."""
-        inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(inspection)
-        db_session.commit()
+        service.delete(self.inspection_id, admin_user)
 
-        service = AnnualInspectionService(db_session)
-        service.delete(inspection.id, admin_user)
+        # Verify deleted in the database, not just in the identity map
+        db_session.expire_all()
+        assert db_session.get(AnnualInspection, self.inspection_id) is None
 
-        # Verify deleted
-        deleted = db_session.query(AnnualInspection).filter(
-            AnnualInspection.id == inspection.id
-        ).first()
-        assert deleted is None
 
-    def test_delete_nonexistent_inspection(
+class TestAnnualInspectionServiceNotFound:
+    """Test the 404 paths shared by get, update and delete."""
+
+    @pytest.mark.parametrize(
+        "method_name,needs_data",
+        [("get", False), ("update", True), ("delete", False)],
+    )
+    def test_nonexistent_inspection(
         self,
-        db_session: Session,
-        admin_user: User
+        service: AnnualInspectionService,
+        admin_user: User,
+        method_name: str,
+        needs_data: bool
     ):
-        """Raises error when deleting non-existent inspection."""
-        service = AnnualInspectionService(db_session)
+        """Raises error when the inspection doesn't exist."""
+        args = [generate_uuid()]
+        if needs_data:
+            args.append(AnnualInspectionUpdate(status=AnnualStatus.PASSED))
 
         with pytest.raises(HTTPException) as exc_info:
-            service.delete(generate_uuid(), admin_user)
+            getattr(service, method_name)(*args, admin_user)
 
         assert exc_info.value.status_code == 404
 
@@ -534,39 +421,34 @@ class TestAnnualInspectionServiceGetAppointmentStatistics:
     def test_returns_statistics_with_appointments(
         self,
         db_session: Session,
+        service: AnnualInspectionService,
+        make_inspection,
         client_user: User,
         client_vehicle: Vehicle,
         sample_inspector: Inspector
     ):
         """Returns correct statistics when appointments exist."""
         # Create annual inspection
-        inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(inspection)
-        db_session.commit()
-
-        # Create 3 appointments
-        for i in range(3):
-            appointment = Appointment(
-                id=generate_uuid(),
+        inspection = make_inspection(client_vehicle)
+
+        # Create 3 appointments in a single INSERT
+        now = datetime.now(timezone.utc)
+        appointment_ids = [generate_uuid() for _ in range(3)]
+        db_session.execute(insert(Appointment), [
+            dict(
+                id=appointment_id,
                 annual_inspection_id=inspection.id,
                 vehicle_id=client_vehicle.id,
                 inspector_id=sample_inspector.id,
                 created_by_user_id=client_user.id,
                 created_channel=CreatedChannel.CLIENT_PORTAL,
-                date_time=datetime.now(timezone.utc) + timedelta(days=i),
+                date_time=now + timedelta(days=i),
                 status=AppointmentStatus.CONFIRMED,
-                confirmation_token=f"CONF-{generate_uuid()[:8]}",
+                confirmation_token=unique_tag("CONF"),
             )
-            db_session.add(appointment)
-        db_session.commit()
+            for i, appointment_id in enumerate(appointment_ids)
+        ])
 
-        service = AnnualInspectionService(db_session)
         stats = service.get_appointment_statistics(inspection.id)
 
         assert stats["total_appointments"] == 3
@@ -574,22 +456,14 @@ class TestAnnualInspectionServiceGetAppointmentStatistics:
 
     def test_returns_zero_when_no_appointments(
         self,
-        db_session: Session,
+        service: AnnualInspectionService,
+        make_inspection,
         client_vehicle: Vehicle
     ):
         """Returns zero count when no appointments exist."""
         # Create annual inspection without appointments
-        inspection = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=client_vehicle.id,
-            year=datetime.now().year,
-            status=AnnualStatus.PENDING,
-            attempt_count=0,
-        )
-        db_session.add(inspection)
-        db_session.commit()
+        inspection = make_inspection(client_vehicle)
 
-        service = AnnualInspectionService(db_session)
         stats = service.get_appointment_statistics(inspection.id)
 
         assert stats["total_appointments"] == 0
@@ -1,6 +1,7 @@
 import pytest
 from datetime import datetime, timezone, timedelta
 from fastapi import HTTPException
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.services.auth_service import AuthService
 from app.models import (
@@ -11,14 +12,30 @@ from app.models import (
 )
 from app.schemas.auth import UserRegister
 from app.core.security import verify_password, create_access_token
+from tests.conftest import _seed_rows
+from tests.helpers import make_user
+
+
+def _add_sessions(db_session: Session, user_id: str, *tokens: str) -> None:
+    """Insert active sessions for a user directly, skipping login's password check."""
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+    db_session.execute(insert(UserSession), [
+        {"id": generate_uuid(), "user_id": user_id, "token": token, "expires_at": expires_at}
+        for token in tokens
+    ])
+
+
+@pytest.fixture
+def service(db_session: Session) -> AuthService:
+    """Auth service bound to this test's session."""
+    return AuthService(db_session)
 
 
 class TestAuthServiceRegisterUser:
     """Test the register_user service method."""
 
-    def test_successful_registration(self, db_session: Session):
+    def test_successful_registration(self, service: AuthService):
         """Successfully register a new user."""
-        service = AuthService(db_session)
         data = UserRegister(
             name="Test User",
             email="test@example.com",
@@ -34,10 +51,9 @@ class TestAuthServiceRegisterUser:
         assert result.is_active is True
         assert verify_password("SecurePass123", result.password_hash)
 
-    def test_cannot_register_duplicate_email(self, db_session: Session):
+    def test_cannot_register_duplicate_email(self, service: AuthService):
         """Cannot register with an email that already exists."""
         # Create first user
-        service = AuthService(db_session)
         data1 = UserRegister(
             name="User One",
             email="duplicate@example.com",
@@ -60,9 +76,8 @@ class TestAuthServiceRegisterUser:
         assert exc_info.value.status_code == 400
         assert "ya está registrado" in exc_info.value.detail.lower()
 
-    def test_password_is_hashed(self, db_session: Session):
-        """Password is properly hashed, not stored in plain text."""
-        service = AuthService(db_session)
+    def test_password_is_hashed(self, service: AuthService, production_password_hashing):
+        """Password is hashed with the production bcrypt scheme, not stored in plain text."""
         data = UserRegister(
             name="Test User",
             email="test@example.com",
@@ -74,13 +89,12 @@ class TestAuthServiceRegisterUser:
 
         # Password should not be stored in plain text
         assert result.password_hash != "MySecretPassword"
+        assert result.password_hash.startswith("$2b$")
         # But should verify correctly
         assert verify_password("MySecretPassword", result.password_hash)
 
-    def test_can_register_different_roles(self, db_session: Session):
+    def test_can_register_different_roles(self, service: AuthService):
         """Can register users with different roles."""
-        service = AuthService(db_session)
-
         # Register as CLIENT
         client_data = UserRegister(
             name="Client User",
@@ -115,78 +129,77 @@ class TestAuthServiceRegisterUser:
 class TestAuthServiceLogin:
     """Test the login service method."""
 
+    @pytest.fixture(scope="module")
+    def _registered_user_id(self, connection) -> str:
+        """Register the login test user once per module."""
+        user_id = generate_uuid()
+        _seed_rows(connection, User(**make_user(
+            id=user_id, name="Login Test User", email="login@example.com", password="CorrectPassword123"
+        )))
+        return user_id
+
     @pytest.fixture
-    def registered_user(self, db_session: Session) -> User:
-        """Create a registered user for login tests."""
-        service = AuthService(db_session)
-        data = UserRegister(
-            name="Login Test User",
-            email="login@example.com",
-            password="CorrectPassword123",
-            role=UserRole.CLIENT
-        )
-        return service.register_user(data)
+    def registered_user(self, db_session: Session, _registered_user_id: str) -> User:
+        """The registered user, loaded into this test's session."""
+        return db_session.get(User, _registered_user_id)
 
-    def test_successful_login(self, db_session: Session, registered_user: User):
-        """Successfully login with correct credentials."""
-        service = AuthService(db_session)
+    def test_login_happy_path(
+        self,
+        db_session: Session,
+        service: AuthService,
+        registered_user: User
+    ):
+        """Each login succeeds, stamps last_login_at and opens its own session."""
+        before_login = datetime.now(timezone.utc)
 
-        access_token, user = service.login("login@example.com", "CorrectPassword123")
+        token1, user = service.login("login@example.com", "CorrectPassword123")
+        token2, _ = service.login("login@example.com", "CorrectPassword123")
 
-        assert access_token is not None
+        assert token1 is not None
+        assert token1 != token2
         assert user.id == registered_user.id
         assert user.email == registered_user.email
 
-        # Verify session was created
-        session = db_session.query(UserSession).filter(
-            UserSession.user_id == user.id,
-            UserSession.token == access_token
-        ).first()
-        assert session is not None
-        assert session.revoked_at is None
-
-    def test_login_updates_last_login(self, db_session: Session, registered_user: User):
-        """Login updates the last_login_at timestamp."""
-        service = AuthService(db_session)
-        before_login = datetime.now(timezone.utc)
-
-        access_token, user = service.login("login@example.com", "CorrectPassword123")
-
-        # Refresh user from database
-        db_session.refresh(user)
         assert user.last_login_at is not None
         # Database stores as naive datetime and truncates microseconds
-        last_login_naive = user.last_login_at.replace(tzinfo=timezone.utc) if user.last_login_at.tzinfo is None else user.last_login_at
+        last_login = user.last_login_at
+        if last_login.tzinfo is None:
+            last_login = last_login.replace(tzinfo=timezone.utc)
         # Allow 1 second tolerance for database precision
-        time_diff = abs((last_login_naive - before_login).total_seconds())
-        assert time_diff < 1
+        assert abs((last_login - before_login).total_seconds()) < 1
 
-    def test_login_with_wrong_password(self, db_session: Session, registered_user: User):
-        """Cannot login with incorrect password."""
-        service = AuthService(db_session)
+        # Both sessions exist and are active
+        sessions = db_session.query(UserSession).filter(
+            UserSession.user_id == registered_user.id
+        ).all()
+        assert {session.token for session in sessions} == {token1, token2}
+        assert all(session.revoked_at is None for session in sessions)
 
+    def test_login_with_wrong_password(self, service: AuthService, registered_user: User):
+        """Cannot login with incorrect password."""
         with pytest.raises(HTTPException) as exc_info:
             service.login("login@example.com", "WrongPassword")
 
         assert exc_info.value.status_code == 401
         assert "incorrectos" in exc_info.value.detail.lower()
 
-    def test_login_with_nonexistent_email(self, db_session: Session):
+    def test_login_with_nonexistent_email(self, service: AuthService):
         """Cannot login with email that doesn't exist."""
-        service = AuthService(db_session)
-
         with pytest.raises(HTTPException) as exc_info:
             service.login("nonexistent@example.com", "AnyPassword")
 
         assert exc_info.value.status_code == 401
 
-    def test_login_with_inactive_user(self, db_session: Session, registered_user: User):
+    def test_login_with_inactive_user(
+        self,
+        db_session: Session,
+        service: AuthService,
+        registered_user: User
+    ):
         """Cannot login if user is inactive."""
         # Deactivate user
         registered_user.is_active = False
-        db_session.commit()
-
-        service = AuthService(db_session)
+        db_session.flush()
 
         with pytest.raises(HTTPException) as exc_info:
             service.login("login@example.com", "CorrectPassword123")
@@ -194,80 +207,49 @@ class TestAuthServiceLogin:
         assert exc_info.value.status_code == 400
         assert "inactivo" in exc_info.value.detail.lower()
 
-    def test_multiple_sessions_can_exist(self, db_session: Session, registered_user: User):
-        """Multiple active sessions can exist for one user."""
-        service = AuthService(db_session)
-
-        # Login twice
-        token1, user1 = service.login("login@example.com", "CorrectPassword123")
-        token2, user2 = service.login("login@example.com", "CorrectPassword123")
-
-        assert token1 != token2
-
-        # Both sessions should exist
-        sessions = db_session.query(UserSession).filter(
-            UserSession.user_id == registered_user.id,
-            UserSession.revoked_at.is_(None)
-        ).all()
-        assert len(sessions) == 2
-
 
 class TestAuthServiceRequestPasswordReset:
     """Test the request_password_reset service method."""
 
+    @pytest.fixture(scope="module")
+    def _registered_user_id(self, connection) -> str:
+        """Register the password reset request user once per module."""
+        user_id = generate_uuid()
+        _seed_rows(connection, User(**make_user(
+            id=user_id, name="Reset Test User", email="reset@example.com", password="Password123"
+        )))
+        return user_id
+
     @pytest.fixture
-    def registered_user(self, db_session: Session) -> User:
-        """Create a registered user."""
-        service = AuthService(db_session)
-        data = UserRegister(
-            name="Reset Test User",
-            email="reset@example.com",
-            password="Password123",
-            role=UserRole.CLIENT
-        )
-        return service.register_user(data)
+    def registered_user(self, db_session: Session, _registered_user_id: str) -> User:
+        """The registered user, loaded into this test's session."""
+        return db_session.get(User, _registered_user_id)
 
     def test_request_reset_for_existing_user(
         self,
-        db_session: Session,
+        service: AuthService,
         registered_user: User,
-        monkeypatch
+        sent_emails
     ):
         """Request password reset for existing user sends email."""
-        # Mock the email sending function
-        email_sent = []
-
-        def mock_send_email(email, token):
-            email_sent.append((email, token))
-
-        # Mock on the auth_service module where it's imported
-        from app.services import auth_service
-        monkeypatch.setattr(auth_service, "send_password_reset_email", mock_send_email)
-
-        service = AuthService(db_session)
         result = service.request_password_reset("reset@example.com")
 
         assert result is True
-        assert len(email_sent) == 1
-        assert email_sent[0][0] == "reset@example.com"
-        assert email_sent[0][1] is not None  # Token was generated
+        assert len(sent_emails) == 1
+        assert sent_emails[0][0] == "reset@example.com"
+        assert sent_emails[0][1] is not None  # Token was generated
 
-    def test_request_reset_for_nonexistent_user(self, db_session: Session):
+    def test_request_reset_for_nonexistent_user(self, service: AuthService, sent_emails):
         """Request password reset for non-existent user returns False."""
-        service = AuthService(db_session)
         result = service.request_password_reset("nonexistent@example.com")
 
         assert result is False
+        assert sent_emails == []
 
-    def test_request_reset_does_not_reveal_existence(
-        self,
-        db_session: Session,
-        monkeypatch
-    ):
+    def test_request_reset_does_not_reveal_existence(self, service: AuthService):
         """Request doesn't reveal if email exists (returns same response)."""
         # This is tested at the route level, service returns bool
         # Just verify it doesn't crash for non-existent users
-        service = AuthService(db_session)
 
         # Should not raise exception
         result = service.request_password_reset("any@email.com")
@@ -277,35 +259,60 @@ class TestAuthServiceRequestPasswordReset:
 class TestAuthServiceResetPassword:
     """Test the reset_password service method."""
 
+    @pytest.fixture(scope="module")
+    def _registered_user_id(self, connection) -> str:
+        """Register the password reset user once per module."""
+        user_id = generate_uuid()
+        _seed_rows(connection, User(**make_user(
+            id=user_id, name="Reset User", email="resetpass@example.com", password="OldPassword123"
+        )))
+        return user_id
+
     @pytest.fixture
-    def registered_user(self, db_session: Session) -> User:
-        """Create a registered user."""
-        service = AuthService(db_session)
-        data = UserRegister(
-            name="Reset User",
-            email="resetpass@example.com",
-            password="OldPassword123",
-            role=UserRole.CLIENT
+    def registered_user(self, db_session: Session, _registered_user_id: str) -> User:
+        """The registered user, loaded into this test's session."""
+        return db_session.get(User, _registered_user_id)
+
+    @pytest.fixture(scope="class")
+    def reset_token(self, _registered_user_id: str) -> str:
+        """Sign one valid password reset token for the whole class."""
+        return create_access_token(
+            data={"sub": _registered_user_id, "type": "password_reset"},
+            expires_delta=timedelta(hours=1)
         )
-        return service.register_user(data)
 
-    @pytest.fixture
-    def reset_token(self, registered_user: User) -> str:
-        """Generate a valid password reset token."""
+    @pytest.fixture(scope="class")
+    def expired_token(self, _registered_user_id: str) -> str:
+        """A password reset token that is already expired."""
+        return create_access_token(
+            data={"sub": _registered_user_id, "type": "password_reset"},
+            expires_delta=timedelta(seconds=-1)
+        )
+
+    @pytest.fixture(scope="class")
+    def access_token(self, _registered_user_id: str) -> str:
+        """A regular access token for the user, not a password_reset one."""
         return create_access_token(
-            data={"sub": registered_user.id, "type": "password_reset"},
+            data={"sub": _registered_user_id, "type": "access"},
+            expires_delta=timedelta(hours=1)
+        )
+
+    @pytest.fixture(scope="class")
+    def unknown_user_token(self) -> str:
+        """A valid password reset token for a user id that doesn't exist."""
+        return create_access_token(
+            data={"sub": generate_uuid(), "type": "password_reset"},
             expires_delta=timedelta(hours=1)
         )
 
     def test_successful_password_reset(
         self,
         db_session: Session,
+        service: AuthService,
         registered_user: User,
         reset_token: str
     ):
         """Successfully reset password with valid token."""
-        service = AuthService(db_session)
-
         service.reset_password(reset_token, "NewPassword456")
 
         # Verify password was changed
@@ -316,14 +323,13 @@ class TestAuthServiceResetPassword:
     def test_reset_revokes_all_sessions(
         self,
         db_session: Session,
+        service: AuthService,
         registered_user: User,
         reset_token: str
     ):
         """Password reset revokes all active sessions."""
         # Create some sessions
-        service = AuthService(db_session)
-        token1, _ = service.login("resetpass@example.com", "OldPassword123")
-        token2, _ = service.login("resetpass@example.com", "OldPassword123")
+        _add_sessions(db_session, registered_user.id, "reset-session-1", "reset-session-2")
 
         # Verify sessions exist
         active_sessions_before = db_session.query(UserSession).filter(
@@ -342,59 +348,33 @@ class TestAuthServiceResetPassword:
         ).count()
         assert active_sessions_after == 0
 
-    def test_reset_with_invalid_token(self, db_session: Session):
+    def test_reset_with_invalid_token(self, service: AuthService):
         """Cannot reset password with invalid token."""
-        service = AuthService(db_session)
-
         with pytest.raises(HTTPException) as exc_info:
             service.reset_password("invalid_token", "NewPassword")
 
         assert exc_info.value.status_code == 400
         assert "inválido" in exc_info.value.detail.lower()
 
-    def test_reset_with_expired_token(self, db_session: Session, registered_user: User):
+    def test_reset_with_expired_token(self, service: AuthService, expired_token: str):
         """Cannot reset password with expired token."""
-        # Create an expired token
-        expired_token = create_access_token(
-            data={"sub": registered_user.id, "type": "password_reset"},
-            expires_delta=timedelta(seconds=-1)  # Already expired
-        )
-
-        service = AuthService(db_session)
-
         with pytest.raises(HTTPException) as exc_info:
             service.reset_password(expired_token, "NewPassword")
 
         assert exc_info.value.status_code == 400
 
-    def test_reset_with_wrong_token_type(self, db_session: Session, registered_user: User):
+    def test_reset_with_wrong_token_type(self, service: AuthService, access_token: str):
         """Cannot reset password with wrong token type."""
-        # Create a regular access token (not password_reset type)
-        wrong_type_token = create_access_token(
-            data={"sub": registered_user.id, "type": "access"},
-            expires_delta=timedelta(hours=1)
-        )
-
-        service = AuthService(db_session)
-
         with pytest.raises(HTTPException) as exc_info:
-            service.reset_password(wrong_type_token, "NewPassword")
+            service.reset_password(access_token, "NewPassword")
 
         assert exc_info.value.status_code == 400
         assert "inválido" in exc_info.value.detail.lower()
 
-    def test_reset_with_nonexistent_user(self, db_session: Session):
+    def test_reset_with_nonexistent_user(self, service: AuthService, unknown_user_token: str):
         """Cannot reset password for non-existent user."""
-        # Create token with fake user ID
-        fake_token = create_access_token(
-            data={"sub": generate_uuid(), "type": "password_reset"},
-            expires_delta=timedelta(hours=1)
-        )
-
-        service = AuthService(db_session)
-
         with pytest.raises(HTTPException) as exc_info:
-            service.reset_password(fake_token, "NewPassword")
+            service.reset_password(unknown_user_token, "NewPassword")
 
         assert exc_info.value.status_code == 404
 
@@ -402,29 +382,34 @@ class TestAuthServiceResetPassword:
 class TestAuthServiceLogout:
     """Test the logout service method."""
 
-    @pytest.fixture
-    def logged_in_user(self, db_session: Session):
-        """Create a logged-in user with active session."""
-        service = AuthService(db_session)
-
-        # Register user
-        data = UserRegister(
-            name="Logout User",
-            email="logout@example.com",
-            password="Password123",
-            role=UserRole.CLIENT
+    @pytest.fixture(scope="module")
+    def _logged_in_ids(self, connection):
+        """Register the logout test user with one active session, once per module."""
+        user_id = generate_uuid()
+        _seed_rows(connection, User(**make_user(
+            id=user_id, name="Logout User", email="logout@example.com", password="Password123"
+        )))
+        token = create_access_token(
+            data={"sub": user_id, "jti": generate_uuid()},
+            expires_delta=timedelta(minutes=30)
         )
-        user = service.register_user(data)
-
-        # Login to create session
-        token, user = service.login("logout@example.com", "Password123")
+        _seed_rows(connection, UserSession(
+            id=generate_uuid(),
+            user_id=user_id,
+            token=token,
+            expires_at=datetime.now(timezone.utc) + timedelta(minutes=30),
+        ))
+        return user_id, token
 
-        return user, token
+    @pytest.fixture
+    def logged_in_user(self, db_session: Session, _logged_in_ids):
+        """A logged-in user with an active session, as ``(user, token)``."""
+        user_id, token = _logged_in_ids
+        return db_session.get(User, user_id), token
 
-    def test_successful_logout(self, db_session: Session, logged_in_user):
+    def test_successful_logout(self, db_session: Session, service: AuthService, logged_in_user):
         """Successfully logout and revoke session."""
         user, token = logged_in_user
-        service = AuthService(db_session)
 
         # Verify session is active
         session_before = db_session.query(UserSession).filter(
@@ -450,29 +435,25 @@ class TestAuthServiceLogout:
         assert revoked_session is not None
         assert revoked_session.revoked_at is not None
 
-    def test_logout_with_nonexistent_session(self, db_session: Session, logged_in_user):
+    def test_logout_with_nonexistent_session(self, service: AuthService, logged_in_user):
         """Logout with non-existent token doesn't raise error."""
         user, _ = logged_in_user
-        service = AuthService(db_session)
 
         # Should not raise exception
         service.logout("nonexistent_token", user.id)
 
-    def test_logout_only_revokes_specific_session(self, db_session: Session):
+    def test_logout_only_revokes_specific_session(
+        self,
+        db_session: Session,
+        service: AuthService,
+        logged_in_user
+    ):
         """Logout only revokes the specific session, not all sessions."""
-        service = AuthService(db_session)
-
-        # Register and login twice
-        data = UserRegister(
-            name="Multi Session User",
-            email="multi@example.com",
-            password="Password123",
-            role=UserRole.CLIENT
-        )
-        user = service.register_user(data)
+        user, token1 = logged_in_user
 
-        token1, _ = service.login("multi@example.com", "Password123")
-        token2, _ = service.login("multi@example.com", "Password123")
+        # Open a second session next to the seeded one
+        token2 = "logout-session-2"
+        _add_sessions(db_session, user.id, token2)
 
         # Logout first session
         service.logout(token1, user.id)
@@ -490,10 +471,9 @@ class TestAuthServiceLogout:
         ).first()
         assert session2 is not None
 
-    def test_logout_already_revoked_session(self, db_session: Session, logged_in_user):
+    def test_logout_already_revoked_session(self, service: AuthService, logged_in_user):
         """Logout already revoked session doesn't cause error."""
         user, token = logged_in_user
-        service = AuthService(db_session)
 
         # Logout once
         service.logout(token, user.id)
@@ -1,27 +1,88 @@
 import pytest
+from datetime import datetime, timezone, timedelta
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 from app.services.check_item_service import CheckItemService
-from app.models import CheckItemTemplate, ItemCheck, InspectionResult, generate_uuid
+from app.models import (
+    AnnualInspection, Appointment, CheckItemTemplate, ItemCheck, InspectionResult, generate_uuid
+)
+from tests.conftest import _seed_rows
+from tests.helpers import count_queries, unique_tag
+
+
+@pytest.fixture
+def service(db_session: Session) -> CheckItemService:
+    """Check item service bound to this test's session."""
+    return CheckItemService(db_session)
+
+
+@pytest.fixture
+def make_template(db_session: Session):
+    """
+    Return a factory that adds a check item template.
+
+    Rows are flushed, not committed, since the test's SAVEPOINT is rolled
+    back afterwards anyway.
+    """
+    def _make(code: str = "TEST", description: str = "Test", ordinal: int = 1) -> CheckItemTemplate:
+        template = CheckItemTemplate(
+            id=generate_uuid(), code=code, description=description, ordinal=ordinal
+        )
+        db_session.add(template)
+        db_session.flush()
+        return template
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def _in_use_scaffolding(connection, _sample_user_id, _other_vehicle_id):
+    """
+    Insert the annual inspection and appointment an inspection result needs.
+
+    They are never modified, so they are seeded once per module on top of the
+    shared sample user and vehicle. Returns ``(annual_id, appointment_id)``.
+    """
+    annual_id = generate_uuid()
+    appointment_id = generate_uuid()
+    annual = AnnualInspection(
+        id=annual_id,
+        vehicle_id=_other_vehicle_id,
+        year=2024,
+        status="PENDING",
+        attempt_count=0
+    )
+    appointment = Appointment(
+        id=appointment_id,
+        annual_inspection_id=annual_id,
+        vehicle_id=_other_vehicle_id,
+        created_by_user_id=_sample_user_id,
+        created_channel="CLIENT_PORTAL",
+        date_time=datetime.now(timezone.utc) + timedelta(days=1),
+        status="CONFIRMED",
+        confirmation_token=unique_tag("CONF")
+    )
+    _seed_rows(connection, annual, appointment)
+    return annual_id, appointment_id
 
 
 class TestCheckItemServiceList:
     """Test the list service method."""
 
-    def test_list_returns_all_templates_ordered(self, db_session: Session):
+    @pytest.mark.strict_loading
+    def test_list_returns_all_templates_ordered(self, db_session: Session, service, make_template):
         """List returns all templates ordered by ordinal."""
-        service = CheckItemService(db_session)
-
         # Create templates with different ordinals
-        template1 = CheckItemTemplate(id=generate_uuid(), code="CODE1", description="First", ordinal=2)
-        template2 = CheckItemTemplate(id=generate_uuid(), code="CODE2", description="Second", ordinal=1)
-        template3 = CheckItemTemplate(id=generate_uuid(), code="CODE3", description="Third", ordinal=3)
-
-        db_session.add_all([template1, template2, template3])
-        db_session.commit()
+        make_template(code="CODE1", description="First", ordinal=2)
+        make_template(code="CODE2", description="Second", ordinal=1)
+        make_template(code="CODE3", description="Third", ordinal=3)
 
-        result = service.list()
+        with count_queries(db_session) as queries:
+            result = service.list()
 
+        # One SELECT, sorted by the database rather than in Python
+        assert len(queries) == 1
+        assert "ORDER BY" in queries[0].upper()
         assert len(result) == 3
         assert result[0].ordinal == 1
         assert result[1].ordinal == 2
@@ -31,54 +92,39 @@ class TestCheckItemServiceList:
 class TestCheckItemServiceGet:
     """Test the get service method."""
 
-    def test_get_returns_template(self, db_session: Session):
+    def test_get_returns_template(self, db_session: Session, service, make_template):
         """Get returns the template by ID."""
-        template = CheckItemTemplate(id=generate_uuid(), code="TEST", description="Test", ordinal=1)
-        db_session.add(template)
-        db_session.commit()
+        template = make_template()
 
-        service = CheckItemService(db_session)
-        result = service.get(template.id)
+        with count_queries(db_session) as queries:
+            result = service.get(template.id)
 
+        # Already in the session's identity map, so no SELECT
+        assert queries == []
         assert result.id == template.id
         assert result.code == "TEST"
 
-    def test_get_nonexistent_raises_404(self, db_session: Session):
-        """Get with nonexistent ID raises 404."""
-        service = CheckItemService(db_session)
-
-        with pytest.raises(HTTPException) as exc_info:
-            service.get(generate_uuid())
-
-        assert exc_info.value.status_code == 404
-
 
 class TestCheckItemServiceCreate:
     """Test the create service method."""
 
-    def test_create_with_valid_data(self, db_session: Session):
+    def test_create_with_valid_data(self, service):
         """Create template with valid data."""
-        service = CheckItemService(db_session)
         result = service.create("BRAKES", "Brake system check", 1)
 
         assert result.code == "BRAKES"
         assert result.description == "Brake system check"
         assert result.ordinal == 1
 
-    def test_create_uppercases_code(self, db_session: Session):
+    def test_create_uppercases_code(self, service):
         """Create automatically uppercases the code."""
-        service = CheckItemService(db_session)
         result = service.create("brakes", "Brake system check", 1)
 
         assert result.code == "BRAKES"
 
-    def test_create_with_duplicate_code_fails(self, db_session: Session):
+    def test_create_with_duplicate_code_fails(self, service, make_template):
         """Cannot create template with duplicate code."""
-        template = CheckItemTemplate(id=generate_uuid(), code="DUPLICATE", description="Test", ordinal=1)
-        db_session.add(template)
-        db_session.commit()
-
-        service = CheckItemService(db_session)
+        make_template(code="DUPLICATE", description="Test", ordinal=1)
 
         with pytest.raises(HTTPException) as exc_info:
             service.create("duplicate", "Another", 2)
@@ -86,13 +132,9 @@ class TestCheckItemServiceCreate:
         assert exc_info.value.status_code == 400
         assert "código" in exc_info.value.detail.lower()
 
-    def test_create_with_duplicate_ordinal_fails(self, db_session: Session):
+    def test_create_with_duplicate_ordinal_fails(self, service, make_template):
         """Cannot create template with duplicate ordinal."""
-        template = CheckItemTemplate(id=generate_uuid(), code="FIRST", description="Test", ordinal=1)
-        db_session.add(template)
-        db_session.commit()
-
-        service = CheckItemService(db_session)
+        make_template(code="FIRST", description="Test", ordinal=1)
 
         with pytest.raises(HTTPException) as exc_info:
             service.create("SECOND", "Another", 1)
@@ -104,70 +146,49 @@ class TestCheckItemServiceCreate:
 class TestCheckItemServiceUpdate:
     """Test the update service method."""
 
-    def test_update_code(self, db_session: Session):
+    def test_update_code(self, db_session: Session, service, make_template):
         """Can update template code."""
-        template = CheckItemTemplate(id=generate_uuid(), code="OLD", description="Test", ordinal=1)
-        db_session.add(template)
-        db_session.commit()
+        template = make_template(code="OLD", description="Test", ordinal=1)
 
-        service = CheckItemService(db_session)
-        result = service.update(template.id, code="new")
+        with count_queries(db_session) as queries:
+            result = service.update(template.id, code="new")
 
+        # The code uniqueness check and the refresh; the template itself
+        # comes from the identity map
+        selects = [q for q in queries if q.lstrip().upper().startswith("SELECT")]
+        assert len(selects) == 2
         assert result.code == "NEW"
 
-    def test_update_description(self, db_session: Session):
+    def test_update_description(self, service, make_template):
         """Can update template description."""
-        template = CheckItemTemplate(id=generate_uuid(), code="TEST", description="Old", ordinal=1)
-        db_session.add(template)
-        db_session.commit()
+        template = make_template(code="TEST", description="Old", ordinal=1)
 
-        service = CheckItemService(db_session)
         result = service.update(template.id, description="New description")
 
         assert result.description == "New description"
 
-    def test_update_ordinal(self, db_session: Session):
+    def test_update_ordinal(self, service, make_template):
         """Can update template ordinal."""
-        template = CheckItemTemplate(id=generate_uuid(), code="TEST", description="Test", ordinal=1)
-        db_session.add(template)
-        db_session.commit()
+        template = make_template()
 
-        service = CheckItemService(db_session)
         result = service.update(template.id, ordinal=5)
 
         assert result.ordinal == 5
 
-    def test_update_nonexistent_raises_404(self, db_session: Session):
-        """Update nonexistent template raises 404."""
-        service = CheckItemService(db_session)
-
-        with pytest.raises(HTTPException) as exc_info:
-            service.update(generate_uuid(), code="NEW")
-
-        assert exc_info.value.status_code == 404
-
-    def test_update_to_duplicate_code_fails(self, db_session: Session):
+    def test_update_to_duplicate_code_fails(self, service, make_template):
         """Cannot update to duplicate code."""
-        template1 = CheckItemTemplate(id=generate_uuid(), code="FIRST", description="Test", ordinal=1)
-        template2 = CheckItemTemplate(id=generate_uuid(), code="SECOND", description="Test", ordinal=2)
-        db_session.add_all([template1, template2])
-        db_session.commit()
-
-        service = CheckItemService(db_session)
+        make_template(code="FIRST", description="Test", ordinal=1)
+        template2 = make_template(code="SECOND", description="Test", ordinal=2)
 
         with pytest.raises(HTTPException) as exc_info:
             service.update(template2.id, code="FIRST")
 
         assert exc_info.value.status_code == 400
 
-    def test_update_to_duplicate_ordinal_fails(self, db_session: Session):
+    def test_update_to_duplicate_ordinal_fails(self, service, make_template):
         """Cannot update to duplicate ordinal."""
-        template1 = CheckItemTemplate(id=generate_uuid(), code="FIRST", description="Test", ordinal=1)
-        template2 = CheckItemTemplate(id=generate_uuid(), code="SECOND", description="Test", ordinal=2)
-        db_session.add_all([template1, template2])
-        db_session.commit()
-
-        service = CheckItemService(db_session)
+        make_template(code="FIRST", description="Test", ordinal=1)
+        template2 = make_template(code="SECOND", description="Test", ordinal=2)
 
         with pytest.raises(HTTPException) as exc_info:
             service.update(template2.id, ordinal=1)
@@ -178,101 +199,56 @@ class TestCheckItemServiceUpdate:
 class TestCheckItemServiceDelete:
     """Test the delete service method."""
 
-    def test_delete_unused_template(self, db_session: Session):
+    def test_delete_unused_template(self, db_session: Session, service, make_template):
         """Can delete template that is not being used."""
-        template = CheckItemTemplate(id=generate_uuid(), code="TEST", description="Test", ordinal=1)
-        db_session.add(template)
-        db_session.commit()
+        template = make_template()
 
-        service = CheckItemService(db_session)
         service.delete(template.id)
 
         # Verify it was deleted
-        assert db_session.query(CheckItemTemplate).filter(CheckItemTemplate.id == template.id).first() is None
-
-    def test_delete_nonexistent_raises_404(self, db_session: Session):
-        """Delete nonexistent template raises 404."""
-        service = CheckItemService(db_session)
-
-        with pytest.raises(HTTPException) as exc_info:
-            service.delete(generate_uuid())
-
-        assert exc_info.value.status_code == 404
+        assert db_session.get(CheckItemTemplate, template.id) is None
 
-    def test_cannot_delete_template_in_use(self, db_session: Session):
+    def test_cannot_delete_template_in_use(self, db_session: Session, service, _in_use_scaffolding):
         """Cannot delete template that is being used in inspections."""
-        from app.models import Vehicle, User, UserRole, AnnualInspection, Appointment
-        from app.schemas.auth import UserRegister
-        from app.services.auth_service import AuthService
-        from datetime import datetime, timezone, timedelta
-
-        # Create necessary entities
-        auth_service = AuthService(db_session)
-        user = auth_service.register_user(UserRegister(
-            name="Test User",
-            email="test@test.com",
-            password="Password123",
-            role=UserRole.CLIENT
-        ))
-
-        vehicle = Vehicle(
-            id=generate_uuid(),
-            plate_number="ABC123",
-            make="Toyota",
-            model="Corolla",
-            year=2020,
-            owner_id=user.id
-        )
-        db_session.add(vehicle)
-
-        annual = AnnualInspection(
-            id=generate_uuid(),
-            vehicle_id=vehicle.id,
-            year=2024,
-            status="PENDING",
-            attempt_count=0
-        )
-        db_session.add(annual)
-
-        appointment = Appointment(
-            id=generate_uuid(),
-            annual_inspection_id=annual.id,
-            vehicle_id=vehicle.id,
-            created_by_user_id=user.id,
-            created_channel="CLIENT_PORTAL",
-            date_time=datetime.now(timezone.utc) + timedelta(days=1),
-            status="CONFIRMED",
-            confirmation_token="TEST123"
-        )
-        db_session.add(appointment)
-        db_session.commit()
+        annual_id, appointment_id = _in_use_scaffolding
 
-        # Create template
+        # An inspection result that uses the template. The rows are linked by
+        # foreign key columns only, so flush the parents before the item check.
         template = CheckItemTemplate(id=generate_uuid(), code="TEST", description="Test", ordinal=1)
-        db_session.add(template)
-        db_session.commit()
-
-        # Create an inspection result using this template
-        result_id = generate_uuid()
         inspection_result = InspectionResult(
-            id=result_id,
-            annual_inspection_id=annual.id,
-            appointment_id=appointment.id,
+            id=generate_uuid(),
+            annual_inspection_id=annual_id,
+            appointment_id=appointment_id,
             total_score=50
         )
-        item_check = ItemCheck(
+        db_session.add_all([template, inspection_result])
+        db_session.flush()
+
+        db_session.add(ItemCheck(
             id=generate_uuid(),
-            inspection_result_id=result_id,
+            inspection_result_id=inspection_result.id,
             check_item_template_id=template.id,
             score=10
-        )
-        db_session.add_all([inspection_result, item_check])
+        ))
         db_session.commit()
 
-        service = CheckItemService(db_session)
-
         with pytest.raises(HTTPException) as exc_info:
             service.delete(template.id)
 
         assert exc_info.value.status_code == 400
         assert "siendo usada" in exc_info.value.detail
+
+
+class TestCheckItemServiceNotFound:
+    """Test the 404 paths shared by get, update and delete."""
+
+    @pytest.mark.parametrize(
+        "method_name,kwargs",
+        [("get", {}), ("update", {"code": "NEW"}), ("delete", {})],
+    )
+    def test_nonexistent_template(self, service, method_name: str, kwargs: dict):
+        """Raises 404 when the template doesn't exist."""
+        with pytest.raises(HTTPException) as exc_info:
+            getattr(service, method_name)(generate_uuid(), **kwargs)
+
+        assert exc_info.value.status_code == 404
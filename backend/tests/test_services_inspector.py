@@ -1,62 +1,50 @@
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import delete, insert
 from sqlalchemy.orm import Session
 from app.services.inspector_service import InspectorService
 from app.models import Inspector, User, UserRole, generate_uuid
-from app.schemas.auth import UserRegister
-from app.services.auth_service import AuthService
+from tests.helpers import count_queries, make_user, unique_tag
+
+
+@pytest.fixture
+def service(db_session: Session) -> InspectorService:
+    """Inspector service bound to this test's session."""
+    return InspectorService(db_session)
 
 
 class TestInspectorServiceCreate:
     """Test the create service method."""
 
     @pytest.fixture
-    def inspector_user(self, db_session: Session) -> User:
+    def inspector_user(self, make_user_row) -> User:
         """Create a user with INSPECTOR role."""
-        auth_service = AuthService(db_session)
-        return auth_service.register_user(UserRegister(
-            name="Inspector User",
-            email="inspector@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-
-    def test_create_inspector_profile(self, db_session: Session, inspector_user: User):
+        return make_user_row(name="Inspector User", role=UserRole.INSPECTOR)
+
+    def test_create_inspector_profile(self, service, inspector_user: User):
         """Can create inspector profile for inspector user."""
-        service = InspectorService(db_session)
         result = service.create(inspector_user.id, "EMP001")
 
         assert result.user_id == inspector_user.id
         assert result.employee_id == "EMP001"
         assert result.active is True
 
-    def test_create_uppercases_employee_id(self, db_session: Session, inspector_user: User):
+    def test_create_uppercases_employee_id(self, service, inspector_user: User):
         """Create uppercases the employee ID."""
-        service = InspectorService(db_session)
         result = service.create(inspector_user.id, "emp001")
 
         assert result.employee_id == "EMP001"
 
-    def test_cannot_create_for_nonexistent_user(self, db_session: Session):
+    def test_cannot_create_for_nonexistent_user(self, service):
         """Cannot create inspector for nonexistent user."""
-        service = InspectorService(db_session)
-
         with pytest.raises(HTTPException) as exc_info:
             service.create(generate_uuid(), "EMP001")
 
         assert exc_info.value.status_code == 404
 
-    def test_cannot_create_for_non_inspector_role(self, db_session: Session):
+    def test_cannot_create_for_non_inspector_role(self, service, make_user_row):
         """Cannot create inspector profile for non-inspector user."""
-        auth_service = AuthService(db_session)
-        client_user = auth_service.register_user(UserRegister(
-            name="Client User",
-            email="client@test.com",
-            password="Password123",
-            role=UserRole.CLIENT
-        ))
-
-        service = InspectorService(db_session)
+        client_user = make_user_row(name="Client User", role=UserRole.CLIENT)
 
         with pytest.raises(HTTPException) as exc_info:
             service.create(client_user.id, "EMP001")
@@ -64,9 +52,8 @@ class TestInspectorServiceCreate:
         assert exc_info.value.status_code == 400
         assert "INSPECTOR" in exc_info.value.detail
 
-    def test_cannot_create_duplicate_for_user(self, db_session: Session, inspector_user: User):
+    def test_cannot_create_duplicate_for_user(self, service, inspector_user: User):
         """Cannot create multiple inspector profiles for same user."""
-        service = InspectorService(db_session)
         service.create(inspector_user.id, "EMP001")
 
         with pytest.raises(HTTPException) as exc_info:
@@ -75,23 +62,11 @@ class TestInspectorServiceCreate:
         assert exc_info.value.status_code == 400
         assert "ya tiene" in exc_info.value.detail.lower()
 
-    def test_cannot_create_duplicate_employee_id(self, db_session: Session):
+    def test_cannot_create_duplicate_employee_id(self, service, make_user_row):
         """Cannot create inspectors with duplicate employee IDs."""
-        auth_service = AuthService(db_session)
-        user1 = auth_service.register_user(UserRegister(
-            name="Inspector 1",
-            email="inspector1@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-        user2 = auth_service.register_user(UserRegister(
-            name="Inspector 2",
-            email="inspector2@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-
-        service = InspectorService(db_session)
+        user1 = make_user_row(name="Inspector 1", role=UserRole.INSPECTOR)
+        user2 = make_user_row(name="Inspector 2", role=UserRole.INSPECTOR)
+
         service.create(user1.id, "EMP001")
 
         with pytest.raises(HTTPException) as exc_info:
@@ -104,179 +79,115 @@ class TestInspectorServiceCreate:
 class TestInspectorServiceList:
     """Test the list service method."""
 
-    def test_list_returns_all_inspectors(self, db_session: Session):
-        """List returns all inspectors."""
-        auth_service = AuthService(db_session)
-        user1 = auth_service.register_user(UserRegister(
-            name="Inspector 1",
-            email="inspector1@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-        user2 = auth_service.register_user(UserRegister(
-            name="Inspector 2",
-            email="inspector2@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-
-        inspector_service = InspectorService(db_session)
-        inspector_service.create(user1.id, "EMP001")
-        inspector_service.create(user2.id, "EMP002")
-
-        inspectors, total = inspector_service.list(page=1, page_size=10)
+    @pytest.fixture(scope="class")
+    def _inspector_ids(self, connection):
+        """
+        Insert three inspectors once for the whole class.
+
+        The rows are deleted again when the class finishes, so the rest of
+        the module never sees them.
+        """
+        user_ids = [generate_uuid() for _ in range(3)]
+        inspector_ids = [generate_uuid() for _ in range(3)]
+        connection.execute(insert(User), [
+            make_user(
+                id=user_id,
+                name=f"Inspector {i}",
+                email=f"{unique_tag('inspector')}@test.com",
+                role=UserRole.INSPECTOR,
+            )
+            for i, user_id in enumerate(user_ids, start=1)
+        ])
+        connection.execute(insert(Inspector), [
+            dict(id=inspector_id, user_id=user_id, employee_id=f"EMP00{i}", active=True)
+            for i, (inspector_id, user_id) in enumerate(zip(inspector_ids, user_ids), start=1)
+        ])
+
+        yield inspector_ids
+
+        connection.execute(delete(Inspector).where(Inspector.id.in_(inspector_ids)))
+        connection.execute(delete(User).where(User.id.in_(user_ids)))
+
+    @pytest.mark.strict_loading
+    def test_list_returns_all_inspectors(self, service, _inspector_ids):
+        """List returns all inspectors, with their users already loaded."""
+        inspectors, total = service.list(page=1, page_size=10)
 
-        assert total == 2
-        assert len(inspectors) == 2
+        assert total == 3
+        assert {inspector.id for inspector in inspectors} == set(_inspector_ids)
+        assert {inspector.user.name for inspector in inspectors} == {
+            "Inspector 1", "Inspector 2", "Inspector 3"
+        }
 
-    def test_list_pagination_works(self, db_session: Session):
+    def test_list_pagination_works(self, db_session: Session, service, _inspector_ids):
         """List pagination works correctly."""
-        auth_service = AuthService(db_session)
-        inspector_service = InspectorService(db_session)
-
-        # Create 3 inspectors
-        for i in range(3):
-            user = auth_service.register_user(UserRegister(
-                name=f"Inspector {i}",
-                email=f"inspector{i}@test.com",
-                password="Password123",
-                role=UserRole.INSPECTOR
-            ))
-            inspector_service.create(user.id, f"EMP00{i}")
-
-        inspectors, total = inspector_service.list(page=1, page_size=2)
+        with count_queries(db_session) as queries:
+            inspectors, total = service.list(page=1, page_size=2)
 
+        # A COUNT, then one page SELECT paginated by the database
+        assert len(queries) == 2
+        assert "LIMIT" in queries[1].upper()
         assert total == 3
         assert len(inspectors) == 2
 
-    def test_list_filter_by_active(self, db_session: Session):
+    def test_list_filter_by_active(self, service, _inspector_ids):
         """List can filter by active status."""
-        auth_service = AuthService(db_session)
-        user1 = auth_service.register_user(UserRegister(
-            name="Inspector 1",
-            email="inspector1@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-        user2 = auth_service.register_user(UserRegister(
-            name="Inspector 2",
-            email="inspector2@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-
-        inspector_service = InspectorService(db_session)
-        inspector1 = inspector_service.create(user1.id, "EMP001")
-        inspector2 = inspector_service.create(user2.id, "EMP002")
-
         # Deactivate first inspector
-        inspector_service.update(inspector1.id, active=False)
+        service.update(_inspector_ids[0], active=False)
 
-        active_inspectors, total = inspector_service.list(page=1, page_size=10, active_only=True)
+        active_inspectors, total = service.list(page=1, page_size=10, active_only=True)
 
-        assert total == 1
-        assert active_inspectors[0].id == inspector2.id
+        assert total == 2
+        assert {inspector.id for inspector in active_inspectors} == set(_inspector_ids[1:])
 
 
 class TestInspectorServiceGet:
     """Test the get service method."""
 
-    def test_get_returns_inspector(self, db_session: Session):
+    def test_get_returns_inspector(self, db_session: Session, service, make_user_row):
         """Get returns the inspector by ID."""
-        auth_service = AuthService(db_session)
-        user = auth_service.register_user(UserRegister(
-            name="Inspector",
-            email="inspector@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
+        user = make_user_row(role=UserRole.INSPECTOR)
+        inspector = service.create(user.id, "EMP001")
 
-        inspector_service = InspectorService(db_session)
-        inspector = inspector_service.create(user.id, "EMP001")
-
-        result = inspector_service.get(inspector.id)
+        with count_queries(db_session) as queries:
+            result = service.get(inspector.id)
 
+        # Already in the session's identity map, so no SELECT
+        assert queries == []
         assert result.id == inspector.id
         assert result.employee_id == "EMP001"
 
-    def test_get_nonexistent_raises_404(self, db_session: Session):
-        """Get with nonexistent ID raises 404."""
-        service = InspectorService(db_session)
-
-        with pytest.raises(HTTPException) as exc_info:
-            service.get(generate_uuid())
-
-        assert exc_info.value.status_code == 404
-
 
 class TestInspectorServiceUpdate:
     """Test the update service method."""
 
-    def test_update_employee_id(self, db_session: Session):
+    def test_update_employee_id(self, service, make_user_row):
         """Can update employee ID."""
-        auth_service = AuthService(db_session)
-        user = auth_service.register_user(UserRegister(
-            name="Inspector",
-            email="inspector@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
+        user = make_user_row(role=UserRole.INSPECTOR)
+        inspector = service.create(user.id, "EMP001")
 
-        inspector_service = InspectorService(db_session)
-        inspector = inspector_service.create(user.id, "EMP001")
-
-        result = inspector_service.update(inspector.id, employee_id="EMP999")
+        result = service.update(inspector.id, employee_id="EMP999")
 
         assert result.employee_id == "EMP999"
 
-    def test_update_active_status(self, db_session: Session):
+    def test_update_active_status(self, service, make_user_row):
         """Can update active status."""
-        auth_service = AuthService(db_session)
-        user = auth_service.register_user(UserRegister(
-            name="Inspector",
-            email="inspector@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-
-        inspector_service = InspectorService(db_session)
-        inspector = inspector_service.create(user.id, "EMP001")
+        user = make_user_row(role=UserRole.INSPECTOR)
+        inspector = service.create(user.id, "EMP001")
 
-        result = inspector_service.update(inspector.id, active=False)
+        result = service.update(inspector.id, active=False)
 
         assert result.active is False
 
-    def test_update_nonexistent_raises_404(self, db_session: Session):
-        """Update nonexistent inspector raises 404."""
-        service = InspectorService(db_session)
-
-        with pytest.raises(HTTPException) as exc_info:
-            service.update(generate_uuid(), employee_id="NEW")
-
-        assert exc_info.value.status_code == 404
-
-    def test_cannot_update_to_duplicate_employee_id(self, db_session: Session):
+    def test_cannot_update_to_duplicate_employee_id(self, service, make_user_row):
         """Cannot update to duplicate employee ID."""
-        auth_service = AuthService(db_session)
-        user1 = auth_service.register_user(UserRegister(
-            name="Inspector 1",
-            email="inspector1@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-        user2 = auth_service.register_user(UserRegister(
-            name="Inspector 2",
-            email="inspector2@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-
-        inspector_service = InspectorService(db_session)
-        inspector1 = inspector_service.create(user1.id, "EMP001")
-        inspector2 = inspector_service.create(user2.id, "EMP002")
+        user1 = make_user_row(name="Inspector 1", role=UserRole.INSPECTOR)
+        user2 = make_user_row(name="Inspector 2", role=UserRole.INSPECTOR)
+        inspector1 = service.create(user1.id, "EMP001")
+        inspector2 = service.create(user2.id, "EMP002")
 
         with pytest.raises(HTTPException) as exc_info:
-            inspector_service.update(inspector2.id, employee_id="EMP001")
+            service.update(inspector2.id, employee_id="EMP001")
 
         assert exc_info.value.status_code == 400
 
@@ -284,29 +195,27 @@ class TestInspectorServiceUpdate:
 class TestInspectorServiceDelete:
     """Test the delete service method."""
 
-    def test_delete_inspector(self, db_session: Session):
+    def test_delete_inspector(self, db_session: Session, service, make_user_row):
         """Can delete inspector profile."""
-        auth_service = AuthService(db_session)
-        user = auth_service.register_user(UserRegister(
-            name="Inspector",
-            email="inspector@test.com",
-            password="Password123",
-            role=UserRole.INSPECTOR
-        ))
-
-        inspector_service = InspectorService(db_session)
-        inspector = inspector_service.create(user.id, "EMP001")
+        user = make_user_row(role=UserRole.INSPECTOR)
+        inspector = service.create(user.id, "EMP001")
 
-        inspector_service.delete(inspector.id)
+        service.delete(inspector.id)
 
         # Verify it was deleted
-        assert db_session.query(Inspector).filter(Inspector.id == inspector.id).first() is None
+        assert db_session.get(Inspector, inspector.id) is None
+
 
-    def test_delete_nonexistent_raises_404(self, db_session: Session):
-        """Delete nonexistent inspector raises 404."""
-        service = InspectorService(db_session)
+class TestInspectorServiceNotFound:
+    """Test the 404 paths shared by get, update and delete."""
 
+    @pytest.mark.parametrize(
+        "method_name,kwargs",
+        [("get", {}), ("update", {"employee_id": "NEW"}), ("delete", {})],
+    )
+    def test_nonexistent_inspector(self, service, method_name: str, kwargs: dict):
+        """Raises 404 when the inspector doesn't exist."""
         with pytest.raises(HTTPException) as exc_info:
-            service.delete(generate_uuid())
+            getattr(service, method_name)(generate_uuid(), **kwargs)
 
         assert exc_info.value.status_code == 404